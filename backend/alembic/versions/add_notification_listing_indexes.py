@@ -0,0 +1,39 @@
+"""Add keyset pagination indexes for notification channels and rules
+
+Revision ID: add_notification_listing_indexes
+Revises: add_notification_logs_rule_sent_index
+Create Date: 2026-10-16
+
+Channel and rule listings page by (created_at, id) descending within an organization.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_notification_listing_indexes'
+down_revision: Union[str, None] = 'add_notification_logs_rule_sent_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_notification_channels_org_created_id',
+        'notification_channels',
+        ['organization_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+    op.create_index(
+        'ix_notification_rules_org_created_id',
+        'notification_rules',
+        ['organization_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notification_rules_org_created_id', table_name='notification_rules')
+    op.drop_index('ix_notification_channels_org_created_id', table_name='notification_channels')
@@ -0,0 +1,32 @@
+"""Add composite index for notification log listings
+
+Revision ID: add_notification_logs_rule_sent_index
+Revises: add_notifications_v2
+Create Date: 2026-10-16
+
+Log listings filter by rule and order by sent_at descending.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_notification_logs_rule_sent_index'
+down_revision: Union[str, None] = 'add_notifications_v2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_notification_logs_rule_id_sent_at',
+        'notification_logs',
+        ['rule_id', sa.text('sent_at DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notification_logs_rule_id_sent_at', table_name='notification_logs')
@@ -0,0 +1,42 @@
+"""Add indexes for notification rule matching and check history lookups
+
+Revision ID: add_notification_matching_indexes
+Revises: notification_enums_to_varchar
+Create Date: 2026-10-16
+
+Rule matching filters enabled rules by organization and trigger; recovery and
+consecutive-failure detection read the latest result statuses for a check.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_notification_matching_indexes'
+down_revision: Union[str, None] = 'notification_enums_to_varchar'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_notification_rules_org_trigger_enabled',
+        'notification_rules',
+        ['organization_id', 'trigger'],
+        unique=False,
+        postgresql_where=sa.text('is_enabled')
+    )
+    op.create_index(
+        'ix_check_results_cfg_id_desc',
+        'check_results',
+        ['check_configuration_id', sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['status']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_check_results_cfg_id_desc', table_name='check_results')
+    op.drop_index('ix_notification_rules_org_trigger_enabled', table_name='notification_rules')
@@ -0,0 +1,59 @@
+"""Store check configuration and result data as jsonb
+
+Revision ID: check_configuration_jsonb
+Revises: partition_notification_logs
+Create Date: 2026-10-16
+
+check_configurations.configuration gets a jsonb_path_ops GIN index so
+containment (@>) lookups such as "checks for this host" use an index instead
+of re-parsing every row. The notification tables are already jsonb.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'check_configuration_jsonb'
+down_revision: Union[str, None] = 'partition_notification_logs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'check_configurations', 'configuration',
+        type_=postgresql.JSONB(),
+        postgresql_using='configuration::jsonb'
+    )
+    op.alter_column(
+        'check_results', 'result_data',
+        type_=postgresql.JSONB(),
+        postgresql_using='result_data::jsonb'
+    )
+    # Built in the migration transaction rather than CONCURRENTLY: the type
+    # change above already rewrote the table under an exclusive lock
+    op.create_index(
+        'ix_check_configurations_configuration_gin',
+        'check_configurations',
+        ['configuration'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'configuration': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_check_configurations_configuration_gin', table_name='check_configurations')
+    op.alter_column(
+        'check_results', 'result_data',
+        type_=sa.JSON(),
+        postgresql_using='result_data::json'
+    )
+    op.alter_column(
+        'check_configurations', 'configuration',
+        type_=sa.JSON(),
+        postgresql_using='configuration::json'
+    )
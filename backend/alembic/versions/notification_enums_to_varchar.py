@@ -0,0 +1,58 @@
+"""Store notification enums as VARCHAR with CHECK constraints
+
+Revision ID: notification_enums_to_varchar
+Revises: add_notification_listing_indexes
+Create Date: 2026-10-16
+
+Channel type, rule trigger and log status move from native Postgres enum types
+to VARCHAR(32) holding the lowercase enum values, constrained by CHECKs.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'notification_enums_to_varchar'
+down_revision: Union[str, None] = 'add_notification_listing_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, native enum type, allowed values, constraint name)
+COLUMNS = [
+    ('notification_channels', 'channel_type', 'notificationchanneltype',
+     ('email', 'webhook'), 'ck_notification_channels_channel_type'),
+    ('notification_rules', 'trigger', 'notificationtrigger',
+     ('check_failure', 'check_recovery', 'incident_opened', 'incident_resolved'), 'ck_notification_rules_trigger'),
+    ('notification_logs', 'status', 'notificationstatus',
+     ('pending', 'sent', 'failed'), 'ck_notification_logs_status'),
+]
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE notification_logs ALTER COLUMN status DROP DEFAULT")
+
+    for table, column, type_name, values, constraint in COLUMNS:
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN "{column}" TYPE VARCHAR(32) USING lower("{column}"::text)'
+        )
+        allowed = ", ".join(f"'{value}'" for value in values)
+        op.create_check_constraint(constraint, table, f'"{column}" IN ({allowed})')
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+    op.execute("ALTER TABLE notification_logs ALTER COLUMN status SET DEFAULT 'pending'")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE notification_logs ALTER COLUMN status DROP DEFAULT")
+
+    for table, column, type_name, values, constraint in COLUMNS:
+        op.drop_constraint(constraint, table, type_='check')
+        labels = ", ".join(f"'{value.upper()}'" for value in values)
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({labels})")
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN "{column}" TYPE {type_name} USING upper("{column}")::{type_name}'
+        )
+
+    op.execute("ALTER TABLE notification_logs ALTER COLUMN status SET DEFAULT 'PENDING'")
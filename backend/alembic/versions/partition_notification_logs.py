@@ -0,0 +1,115 @@
+"""Partition notification_logs by month on sent_at
+
+Revision ID: partition_notification_logs
+Revises: add_notification_matching_indexes
+Create Date: 2026-10-16
+
+Inserts land in a small monthly partition and old months can be dropped
+wholesale. Partitioning requires the partition key in the primary key, so it
+becomes (id, sent_at). Monthly partitions are created here for existing data
+and the next few months; the application keeps creating upcoming ones.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'partition_notification_logs'
+down_revision: Union[str, None] = 'add_notification_matching_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_indexes() -> None:
+    """Recreate the indexes notification_logs had before the swap"""
+    op.create_index('ix_notification_logs_id', 'notification_logs', ['id'], unique=False)
+    op.create_index('ix_notification_logs_rule_id', 'notification_logs', ['rule_id'], unique=False)
+    op.create_index('ix_notification_logs_check_result_id', 'notification_logs', ['check_result_id'], unique=False)
+    op.create_index('ix_notification_logs_status', 'notification_logs', ['status'], unique=False)
+    op.create_index('ix_notification_logs_sent_at', 'notification_logs', ['sent_at'], unique=False)
+    op.create_index(
+        'ix_notification_logs_rule_id_sent_at',
+        'notification_logs',
+        ['rule_id', sa.text('sent_at DESC')],
+        unique=False
+    )
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE notification_logs_partitioned (
+            id INTEGER NOT NULL DEFAULT nextval('notification_logs_id_seq'),
+            rule_id INTEGER NOT NULL REFERENCES notification_rules(id) ON DELETE CASCADE,
+            check_result_id INTEGER REFERENCES check_results(id) ON DELETE SET NULL,
+            incident_id INTEGER REFERENCES incidents(id) ON DELETE SET NULL,
+            status VARCHAR(32) NOT NULL DEFAULT 'pending',
+            error_message TEXT,
+            sent_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT ck_notification_logs_status CHECK (status IN ('pending', 'sent', 'failed'))
+        ) PARTITION BY RANGE (sent_at)
+    """)
+
+    # One partition per month from the oldest log through two months ahead,
+    # plus a default partition so an insert never fails for lack of one.
+    # Months and bounds are UTC whatever the session TimeZone, matching the
+    # partitions ensure_log_partitions() creates later.
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start date := date_trunc(
+                'month', coalesce((SELECT min(sent_at) FROM notification_logs), now()) AT TIME ZONE 'UTC'
+            );
+            last_month date := date_trunc('month', now() AT TIME ZONE 'UTC') + interval '2 months';
+            month_end date;
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                month_end := month_start + interval '1 month';
+                EXECUTE format(
+                    'CREATE TABLE notification_logs_p%s PARTITION OF notification_logs_partitioned '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    to_char(month_start, 'YYYYMM'),
+                    month_start::text || ' 00:00:00+00',
+                    month_end::text || ' 00:00:00+00'
+                );
+                month_start := month_end;
+            END LOOP;
+        END $$;
+    """)
+    op.execute("CREATE TABLE notification_logs_default PARTITION OF notification_logs_partitioned DEFAULT")
+
+    op.execute("INSERT INTO notification_logs_partitioned SELECT id, rule_id, check_result_id, incident_id, status, error_message, sent_at FROM notification_logs")
+
+    # Keep the id sequence alive when the old table goes
+    op.execute("ALTER SEQUENCE notification_logs_id_seq OWNED BY NONE")
+    op.execute("DROP TABLE notification_logs")
+    op.execute("ALTER TABLE notification_logs_partitioned RENAME TO notification_logs")
+    op.execute("ALTER SEQUENCE notification_logs_id_seq OWNED BY notification_logs.id")
+    op.execute("ALTER TABLE notification_logs ADD CONSTRAINT notification_logs_pkey PRIMARY KEY (id, sent_at)")
+    _create_indexes()
+    op.create_index('ix_notification_logs_incident_id', 'notification_logs', ['incident_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE TABLE notification_logs_plain (
+            id INTEGER NOT NULL DEFAULT nextval('notification_logs_id_seq'),
+            rule_id INTEGER NOT NULL REFERENCES notification_rules(id) ON DELETE CASCADE,
+            check_result_id INTEGER REFERENCES check_results(id) ON DELETE SET NULL,
+            incident_id INTEGER REFERENCES incidents(id) ON DELETE SET NULL,
+            status VARCHAR(32) NOT NULL DEFAULT 'pending',
+            error_message TEXT,
+            sent_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT ck_notification_logs_status CHECK (status IN ('pending', 'sent', 'failed'))
+        )
+    """)
+    op.execute("INSERT INTO notification_logs_plain SELECT id, rule_id, check_result_id, incident_id, status, error_message, sent_at FROM notification_logs")
+
+    op.execute("ALTER SEQUENCE notification_logs_id_seq OWNED BY NONE")
+    # Dropping the parent drops every partition
+    op.execute("DROP TABLE notification_logs")
+    op.execute("ALTER TABLE notification_logs_plain RENAME TO notification_logs")
+    op.execute("ALTER SEQUENCE notification_logs_id_seq OWNED BY notification_logs.id")
+    op.execute("ALTER TABLE notification_logs ADD CONSTRAINT notification_logs_pkey PRIMARY KEY (id)")
+    _create_indexes()
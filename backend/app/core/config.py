@@ -24,6 +24,14 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: Optional[str] = None
     SMTP_FROM: str = "noreply@healthcheck.com"
 
+    # Checks
+    HTTP_CHECK_CONCURRENCY: int = 100  # Max in-flight requests on the shared HTTP client
+    SSL_CHECK_CONCURRENCY: int = 64  # Max simultaneous TLS handshakes for certificate checks
+
+    # Notifications
+    NOTIFICATION_WORKERS: int = 4  # Background tasks delivering queued notifications
+    NOTIFICATION_BATCH_SIZE: int = 50  # Max deliveries a worker sends and records in one commit
+
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:8000"]
 
@@ -36,8 +36,10 @@ def create_scheduler() -> AsyncIOScheduler:
 
     # Job defaults
     job_defaults = {
-        'coalesce': False,  # Run all missed jobs (important for health checks)
-        'max_instances': 3,  # Max concurrent instances per job
+        # After a stall, run a missed job once instead of replaying every missed
+        # run back to back; a burst of stale checks would hog the event loop
+        'coalesce': True,
+        'max_instances': 1,  # A job still running is skipped rather than overlapped
         'misfire_grace_time': 60  # 1 minute grace for missed jobs
     }
 
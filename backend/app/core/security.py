@@ -17,6 +17,15 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
 
 
+def _credentials_exception() -> HTTPException:
+    """401 raised for any missing, invalid or unknown-user token"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -56,52 +65,52 @@ def decode_token(token: str) -> Dict[str, Any]:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception()
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-):
+async def get_token_user_id(token: str = Depends(oauth2_scheme)) -> int:
     """
-    Get the current authenticated user from JWT token.
-    This will be imported and used after User model is created.
+    Validate the access token and return the user id it carries.
+    Kept free of database access so bad tokens are rejected before a session is opened.
     """
-    from app.domains.auth.models import User
-
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
     try:
         payload = decode_token(token)
         user_id_str: str = payload.get("sub")
         token_type: str = payload.get("type")
 
         if user_id_str is None or token_type != "access":
-            raise credentials_exception
+            raise _credentials_exception()
 
         # Convert user_id from string to int
         try:
             user_id: int = int(user_id_str)
         except (ValueError, TypeError):
-            raise credentials_exception
+            raise _credentials_exception()
 
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    return user_id
+
+
+async def get_current_user(
+    user_id: int = Depends(get_token_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Load the user identified by the access token.
+
+    Token validation happens first in get_token_user_id, without a database
+    session; only a valid token gets this far and costs a user lookup.
+    """
+    from app.domains.auth.models import User
 
     # Fetch user from database
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     if not user.is_active:
         raise HTTPException(
@@ -1,5 +1,6 @@
 """Checks domain models"""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, Text, Enum as SQLEnum, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, Text, Enum as SQLEnum, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -40,7 +41,7 @@ class CheckConfiguration(Base):
     name = Column(String(255), nullable=False)
 
     # Check-specific configuration stored as JSONB
-    configuration = Column(JSON, nullable=False, default=dict)
+    configuration = Column(JSONB, nullable=False, default=dict)
 
     # Scheduling
     interval_seconds = Column(Integer, nullable=False, default=300)  # 5 minutes default
@@ -57,6 +58,16 @@ class CheckConfiguration(Base):
     check_results = relationship("CheckResult", back_populates="check_configuration", cascade="all, delete-orphan", lazy="select")
     incidents = relationship("Incident", back_populates="check_configuration", cascade="all, delete-orphan", lazy="select")
 
+    # Serves configuration containment (@>) lookups, e.g. all checks for a host
+    __table_args__ = (
+        Index(
+            "ix_check_configurations_configuration_gin",
+            configuration,
+            postgresql_using="gin",
+            postgresql_ops={"configuration": "jsonb_path_ops"},
+        ),
+    )
+
     def __repr__(self):
         return f"<CheckConfiguration(id={self.id}, type='{self.check_type}', name='{self.name}')>"
 
@@ -78,12 +89,22 @@ class CheckResult(Base):
     # Error details
     error_message = Column(Text, nullable=True)
 
-    # Additional result data (JSON)
-    result_data = Column(JSON, nullable=True)
+    # Additional result data (JSONB)
+    result_data = Column(JSONB, nullable=True)
 
     # Timestamp
     checked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
 
+    # Serves "latest results for a check" lookups as index-only scans
+    __table_args__ = (
+        Index(
+            "ix_check_results_cfg_id_desc",
+            check_configuration_id,
+            id.desc(),
+            postgresql_include=["status"],
+        ),
+    )
+
     # Relationships
     check_configuration = relationship("CheckConfiguration", back_populates="check_results")
 
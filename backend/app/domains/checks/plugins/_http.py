@@ -0,0 +1,62 @@
+"""Shared HTTP client for check plugins"""
+import asyncio
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Caps in-flight requests so a burst of scheduled checks can't flood remote hosts
+_GATE = asyncio.Semaphore(settings.HTTP_CHECK_CONCURRENCY)
+
+
+async def get_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Reusing one pooled client keeps connections alive between checks instead of
+    paying a new TCP/TLS handshake on every execution. Idle connections are kept
+    for a full default check interval (5 minutes) so the next poll of a site can
+    reuse them. HTTP/2 lets concurrent checks against the same host multiplex
+    over a single connection. Redirect handling is chosen per request by each
+    plugin.
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=300,
+            ),
+            follow_redirects=False,
+        )
+    return _CLIENT
+
+
+async def run_http(request_fn: Callable[[httpx.AsyncClient], Awaitable[T]]) -> T:
+    """
+    Run a request against the shared client under the concurrency gate.
+
+    Args:
+        request_fn: Coroutine function receiving the client and performing the request
+
+    Returns:
+        Whatever request_fn returns
+    """
+    client = await get_client()
+    async with _GATE:
+        return await request_fn(client)
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)"""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
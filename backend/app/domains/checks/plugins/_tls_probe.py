@@ -0,0 +1,83 @@
+"""Shared TLS handshake probe for check plugins"""
+import asyncio
+import contextlib
+import ssl
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+# Loading CA bundles is expensive, so one verifying context is shared by all probes
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Caps simultaneous handshakes so a large sweep can't exhaust sockets or CPU
+_GATE = asyncio.Semaphore(settings.SSL_CHECK_CONCURRENCY)
+
+# In-flight handshakes keyed by (hostname, port), so concurrent callers share one
+_IN_FLIGHT: Dict[Tuple[str, int], "asyncio.Future[TLSProbeResult]"] = {}
+
+
+@dataclass(frozen=True)
+class TLSProbeResult:
+    """What a single TLS handshake tells us about an endpoint"""
+    peercert: Dict[str, Any]
+    tls_version: Optional[str]
+    cipher: Optional[str]
+
+
+async def _handshake(hostname: str, port: int, timeout: float) -> TLSProbeResult:
+    """Open a verified TLS connection and read the negotiated session details"""
+    # Time spent queued at the gate doesn't count against the handshake timeout
+    async with _GATE:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(hostname, port, ssl=_SSL_CONTEXT, server_hostname=hostname),
+            timeout=timeout
+        )
+    try:
+        cipher = writer.get_extra_info("cipher")
+        ssl_object = writer.get_extra_info("ssl_object")
+        return TLSProbeResult(
+            peercert=writer.get_extra_info("peercert") or {},
+            tls_version=ssl_object.version() if ssl_object else None,
+            cipher=cipher[0] if cipher else None,
+        )
+    finally:
+        writer.close()
+        # Wait for the TLS shutdown so sockets don't linger half-closed; a peer
+        # that mishandles close_notify is not the probe's problem
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(writer.wait_closed(), timeout=timeout)
+
+
+def _forget(key: Tuple[str, int], task: "asyncio.Future[TLSProbeResult]") -> None:
+    """Drop a finished handshake and mark its exception as retrieved"""
+    if _IN_FLIGHT.get(key) is task:
+        del _IN_FLIGHT[key]
+    if not task.cancelled():
+        task.exception()
+
+
+async def probe(hostname: str, port: int, timeout: float) -> TLSProbeResult:
+    """
+    Perform a TLS handshake against hostname:port.
+
+    Callers probing the same endpoint while a handshake is already running
+    await that handshake instead of opening another connection.
+
+    Args:
+        hostname: Server name to connect to and verify
+        port: TCP port
+        timeout: Connect and handshake timeout in seconds
+
+    Returns:
+        TLSProbeResult with the peer certificate, protocol version and cipher
+    """
+    key = (hostname, port)
+    task = _IN_FLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_handshake(hostname, port, timeout))
+        _IN_FLIGHT[key] = task
+        task.add_done_callback(lambda t: _forget(key, t))
+
+    # Shield so one caller timing out does not cancel the handshake for the others
+    return await asyncio.shield(task)
@@ -1,8 +1,23 @@
+import re
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
 from pydantic import BaseModel, Field
 
+_HOST_RE = re.compile(r"^(?:[a-z][a-z0-9+.-]*://)?([^/:?#]+)", re.IGNORECASE)
+
+
+def extract_host(url: str) -> str:
+    """Extract the bare hostname from a URL (scheme, port and path stripped)"""
+    match = _HOST_RE.match(url)
+    return match.group(1) if match else url
+
+
+def elapsed_ms(start_ns: int) -> int:
+    """Milliseconds elapsed since a time.perf_counter_ns() reading"""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
 
 class CheckResult(BaseModel):
     status: str = Field(..., description="Status: 'success', 'failure', or 'warning'")
@@ -13,20 +28,10 @@ class CheckResult(BaseModel):
 
 
 class BaseCheck(ABC):
-    @property
-    @abstractmethod
-    def check_type(self) -> str:
-        pass
-
-    @property
-    @abstractmethod
-    def display_name(self) -> str:
-        pass
-
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        pass
+    # Static plugin metadata, readable without instantiating the check
+    check_type: ClassVar[str]
+    display_name: ClassVar[str]
+    description: ClassVar[str]
 
     @abstractmethod
     async def execute(self, site_url: str, config: Dict[str, Any]) -> CheckResult:
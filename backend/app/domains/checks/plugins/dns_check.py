@@ -3,9 +3,8 @@ import time
 import asyncio
 import socket
 from typing import Any, Dict, List
-from urllib.parse import urlparse
 
-from .base import BaseCheck, CheckResult
+from .base import BaseCheck, CheckResult, extract_host, elapsed_ms
 from .registry import register_check
 
 
@@ -13,43 +12,50 @@ from .registry import register_check
 class DNSCheck(BaseCheck):
     """Check that verifies DNS resolution for a domain"""
 
-    @property
-    def check_type(self) -> str:
-        return "dns"
-
-    @property
-    def display_name(self) -> str:
-        return "DNS Resolution Check"
-
-    @property
-    def description(self) -> str:
-        return "Verifies DNS records resolve correctly and optionally checks expected values"
+    check_type = "dns"
+    display_name = "DNS Resolution Check"
+    description = "Verifies DNS records resolve correctly and optionally checks expected values"
+
+    _CONFIG_SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "record_type": {
+                "type": "string",
+                "enum": ["A", "AAAA", "CNAME", "MX"],
+                "default": "A",
+                "description": "DNS record type to check"
+            },
+            "expected_values": {
+                "type": "array",
+                "items": {"type": "string"},
+                "default": [],
+                "description": "Expected DNS values (leave empty to just verify resolution)"
+            },
+            "timeout_seconds": {
+                "type": "integer",
+                "default": 10,
+                "minimum": 1,
+                "maximum": 30,
+                "description": "Query timeout in seconds"
+            }
+        }
+    }
 
     async def execute(self, site_url: str, config: Dict[str, Any]) -> CheckResult:
         record_type = config.get("record_type", "A")
         expected_values = config.get("expected_values", [])
         timeout_seconds = config.get("timeout_seconds", 10)
 
-        # Extract hostname from URL
-        parsed = urlparse(site_url)
-        hostname = parsed.netloc or parsed.path
-        # Remove port if present
-        if ":" in hostname:
-            hostname = hostname.split(":")[0]
+        hostname = extract_host(site_url)
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            # Use asyncio's DNS resolution
-            loop = asyncio.get_event_loop()
-
+            # Resolver calls are blocking, so they run in worker threads
             if record_type == "A":
                 # IPv4 address lookup
                 resolved = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None,
-                        lambda: socket.gethostbyname_ex(hostname)
-                    ),
+                    asyncio.to_thread(socket.gethostbyname_ex, hostname),
                     timeout=timeout_seconds
                 )
                 resolved_values = resolved[2]  # List of IP addresses
@@ -57,10 +63,7 @@ class DNSCheck(BaseCheck):
             elif record_type == "AAAA":
                 # IPv6 address lookup
                 resolved = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None,
-                        lambda: socket.getaddrinfo(hostname, None, socket.AF_INET6)
-                    ),
+                    asyncio.to_thread(socket.getaddrinfo, hostname, None, socket.AF_INET6),
                     timeout=timeout_seconds
                 )
                 resolved_values = list(set(addr[4][0] for addr in resolved))
@@ -68,10 +71,7 @@ class DNSCheck(BaseCheck):
             elif record_type == "CNAME":
                 # CNAME lookup (returns canonical name)
                 resolved = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None,
-                        lambda: socket.gethostbyname_ex(hostname)
-                    ),
+                    asyncio.to_thread(socket.gethostbyname_ex, hostname),
                     timeout=timeout_seconds
                 )
                 resolved_values = [resolved[0]] if resolved[0] != hostname else []
@@ -81,20 +81,14 @@ class DNSCheck(BaseCheck):
                 try:
                     import dns.resolver
                     answers = await asyncio.wait_for(
-                        loop.run_in_executor(
-                            None,
-                            lambda: dns.resolver.resolve(hostname, "MX")
-                        ),
+                        asyncio.to_thread(dns.resolver.resolve, hostname, "MX"),
                         timeout=timeout_seconds
                     )
                     resolved_values = [str(rdata.exchange).rstrip('.') for rdata in answers]
                 except ImportError:
                     # Fallback: just verify the domain exists
                     await asyncio.wait_for(
-                        loop.run_in_executor(
-                            None,
-                            lambda: socket.gethostbyname(hostname)
-                        ),
+                        asyncio.to_thread(socket.gethostbyname, hostname),
                         timeout=timeout_seconds
                     )
                     resolved_values = ["MX lookup requires dnspython"]
@@ -102,15 +96,12 @@ class DNSCheck(BaseCheck):
             else:
                 # Default to A record
                 resolved = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None,
-                        lambda: socket.gethostbyname_ex(hostname)
-                    ),
+                    asyncio.to_thread(socket.gethostbyname_ex, hostname),
                     timeout=timeout_seconds
                 )
                 resolved_values = resolved[2]
 
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
 
             # Check if expected values match (if specified)
             if expected_values:
@@ -139,7 +130,7 @@ class DNSCheck(BaseCheck):
             )
 
         except socket.gaierror as e:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -152,7 +143,7 @@ class DNSCheck(BaseCheck):
             )
 
         except asyncio.TimeoutError:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -164,7 +155,7 @@ class DNSCheck(BaseCheck):
             )
 
         except Exception as e:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -176,27 +167,4 @@ class DNSCheck(BaseCheck):
             )
 
     def get_config_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "record_type": {
-                    "type": "string",
-                    "enum": ["A", "AAAA", "CNAME", "MX"],
-                    "default": "A",
-                    "description": "DNS record type to check"
-                },
-                "expected_values": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "default": [],
-                    "description": "Expected DNS values (leave empty to just verify resolution)"
-                },
-                "timeout_seconds": {
-                    "type": "integer",
-                    "default": 10,
-                    "minimum": 1,
-                    "maximum": 30,
-                    "description": "Query timeout in seconds"
-                }
-            }
-        }
+        return self._CONFIG_SCHEMA
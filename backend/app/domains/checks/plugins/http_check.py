@@ -1,36 +1,91 @@
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import httpx
-from .base import BaseCheck, CheckResult
+from ._http import run_http
+from .base import BaseCheck, CheckResult, elapsed_ms
 from .registry import register_check
 
 
+# Bodies up to this size are read through so the connection can go back to
+# the pool; a larger body is abandoned and its connection closed instead
+MAX_DRAIN_BYTES = 1024 * 1024
+
+
+async def _drain(response: httpx.Response) -> Optional[int]:
+    """
+    Read and discard the response body.
+
+    Returns:
+        The body size in bytes, or None if it exceeded MAX_DRAIN_BYTES
+    """
+    size = 0
+    async for chunk in response.aiter_bytes():
+        size += len(chunk)
+        if size > MAX_DRAIN_BYTES:
+            return None
+    return size
+
+
 @register_check
 class HTTPCheck(BaseCheck):
-    @property
-    def check_type(self) -> str:
-        return "http"
-
-    @property
-    def display_name(self) -> str:
-        return "HTTP Status Check"
+    check_type = "http"
+    display_name = "HTTP Status Check"
+    description = "Verifies HTTP status code and measures response time"
 
-    @property
-    def description(self) -> str:
-        return "Verifies HTTP status code and measures response time"
+    _CONFIG_SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "expected_status_code": {
+                "type": "integer",
+                "default": 200,
+                "description": "Expected HTTP status code"
+            },
+            "timeout_seconds": {
+                "type": "integer",
+                "default": 10,
+                "minimum": 1,
+                "maximum": 60,
+                "description": "Request timeout in seconds"
+            },
+            "follow_redirects": {
+                "type": "boolean",
+                "default": True,
+                "description": "Follow HTTP redirects"
+            }
+        }
+    }
 
     async def execute(self, site_url: str, config: Dict[str, Any]) -> CheckResult:
         expected_status = config.get("expected_status_code", 200)
         timeout_seconds = config.get("timeout_seconds", 10)
         follow_redirects = config.get("follow_redirects", True)
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            async with httpx.AsyncClient(follow_redirects=follow_redirects) as client:
-                response = await client.get(site_url, timeout=timeout_seconds)
+            async def fetch(client: httpx.AsyncClient):
+                # Streamed so time to first byte can be measured; the body is
+                # drained rather than kept, and HTTP/1.1 connections are only
+                # reused once it has been read to the end
+                async with client.stream(
+                    "GET",
+                    site_url,
+                    timeout=timeout_seconds,
+                    follow_redirects=follow_redirects
+                ) as response:
+                    ttfb_ms = elapsed_ms(start_ns)
+                    body_size = await _drain(response)
+                    return response, ttfb_ms, body_size
+
+            response, ttfb_ms, body_size = await run_http(fetch)
+            if body_size is None:
+                # Oversized body: fall back to what the server declared
+                header_length = response.headers.get("content-length")
+                content_length = int(header_length) if header_length else None
+            else:
+                content_length = body_size
 
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
 
             if response.status_code == expected_status:
                 return CheckResult(
@@ -39,7 +94,9 @@ class HTTPCheck(BaseCheck):
                     error_message=None,
                     result_data={
                         "status_code": response.status_code,
-                        "content_length": len(response.content),
+                        "content_length": content_length,
+                        "ttfb_ms": ttfb_ms,
+                        "response_time_ms": response_time_ms,
                         "headers": dict(response.headers)
                     }
                 )
@@ -55,7 +112,7 @@ class HTTPCheck(BaseCheck):
                 )
 
         except httpx.TimeoutException:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -64,7 +121,7 @@ class HTTPCheck(BaseCheck):
             )
 
         except Exception as e:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -73,25 +130,4 @@ class HTTPCheck(BaseCheck):
             )
 
     def get_config_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "expected_status_code": {
-                    "type": "integer",
-                    "default": 200,
-                    "description": "Expected HTTP status code"
-                },
-                "timeout_seconds": {
-                    "type": "integer",
-                    "default": 10,
-                    "minimum": 1,
-                    "maximum": 60,
-                    "description": "Request timeout in seconds"
-                },
-                "follow_redirects": {
-                    "type": "boolean",
-                    "default": True,
-                    "description": "Follow HTTP redirects"
-                }
-            }
-        }
+        return self._CONFIG_SCHEMA
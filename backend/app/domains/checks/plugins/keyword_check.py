@@ -4,7 +4,8 @@ import re
 from typing import Any, Dict, List
 import httpx
 
-from .base import BaseCheck, CheckResult
+from ._http import run_http
+from .base import BaseCheck, CheckResult, elapsed_ms
 from .registry import register_check
 
 
@@ -12,17 +13,44 @@ from .registry import register_check
 class KeywordCheck(BaseCheck):
     """Check that verifies specific keywords or patterns exist (or don't exist) in page content"""
 
-    @property
-    def check_type(self) -> str:
-        return "keyword"
-
-    @property
-    def display_name(self) -> str:
-        return "Keyword/Content Check"
-
-    @property
-    def description(self) -> str:
-        return "Verifies that specific keywords or patterns exist (or are absent) in the page content"
+    check_type = "keyword"
+    display_name = "Keyword/Content Check"
+    description = "Verifies that specific keywords or patterns exist (or are absent) in the page content"
+
+    _CONFIG_SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "keywords_present": {
+                "type": "array",
+                "items": {"type": "string"},
+                "default": [],
+                "description": "Keywords or patterns that MUST be present in the page"
+            },
+            "keywords_absent": {
+                "type": "array",
+                "items": {"type": "string"},
+                "default": [],
+                "description": "Keywords or patterns that must NOT be present (e.g., error messages)"
+            },
+            "use_regex": {
+                "type": "boolean",
+                "default": False,
+                "description": "Treat keywords as regular expressions"
+            },
+            "case_sensitive": {
+                "type": "boolean",
+                "default": False,
+                "description": "Perform case-sensitive matching"
+            },
+            "timeout_seconds": {
+                "type": "integer",
+                "default": 10,
+                "minimum": 1,
+                "maximum": 60,
+                "description": "Request timeout in seconds"
+            }
+        }
+    }
 
     async def execute(self, site_url: str, config: Dict[str, Any]) -> CheckResult:
         keywords_present = config.get("keywords_present", [])
@@ -31,14 +59,15 @@ class KeywordCheck(BaseCheck):
         case_sensitive = config.get("case_sensitive", False)
         timeout_seconds = config.get("timeout_seconds", 10)
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Fetch page content
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                response = await client.get(site_url, timeout=timeout_seconds)
+            response = await run_http(
+                lambda client: client.get(site_url, timeout=timeout_seconds, follow_redirects=True)
+            )
 
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             content = response.text
 
             # Prepare content for matching
@@ -104,7 +133,7 @@ class KeywordCheck(BaseCheck):
             )
 
         except httpx.TimeoutException:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -113,7 +142,7 @@ class KeywordCheck(BaseCheck):
             )
 
         except Exception as e:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -122,37 +151,4 @@ class KeywordCheck(BaseCheck):
             )
 
     def get_config_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "keywords_present": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "default": [],
-                    "description": "Keywords or patterns that MUST be present in the page"
-                },
-                "keywords_absent": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "default": [],
-                    "description": "Keywords or patterns that must NOT be present (e.g., error messages)"
-                },
-                "use_regex": {
-                    "type": "boolean",
-                    "default": False,
-                    "description": "Treat keywords as regular expressions"
-                },
-                "case_sensitive": {
-                    "type": "boolean",
-                    "default": False,
-                    "description": "Perform case-sensitive matching"
-                },
-                "timeout_seconds": {
-                    "type": "integer",
-                    "default": 10,
-                    "minimum": 1,
-                    "maximum": 60,
-                    "description": "Request timeout in seconds"
-                }
-            }
-        }
+        return self._CONFIG_SCHEMA
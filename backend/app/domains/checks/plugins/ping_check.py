@@ -2,73 +2,226 @@
 import time
 import asyncio
 import platform
+import re
+import shutil
 import subprocess
-from typing import Any, Dict
-from urllib.parse import urlparse
+from typing import Any, Dict, Set, Tuple
 
-from .base import BaseCheck, CheckResult
+from .base import BaseCheck, CheckResult, extract_host, elapsed_ms
 from .registry import register_check
 
+# Resolved once at import so missing binaries don't cost a fork+exec per check
+_PING_BIN = shutil.which("ping")
+_FPING_BIN = shutil.which("fping")
+
+# fping -C summary line: "example.com : 10.12 11.03 -"
+_FPING_LINE_RE = re.compile(r"^(\S+)\s+:\s+([\d.\s-]+)$", re.MULTILINE)
+
+
+class PingBatcher:
+    """
+    Coalesces concurrent ping requests into a single fping invocation.
+
+    Requests with the same count and timeout that arrive within a short window
+    are flushed together, so N concurrent ping checks fork one fping process
+    per batch instead of N ping processes.
+    """
+
+    def __init__(self, delay_seconds: float = 0.05, max_hosts: int = 64):
+        self._delay_seconds = delay_seconds
+        self._max_hosts = max_hosts
+        self._pending: Dict[Tuple[int, int], Dict[str, asyncio.Future]] = {}
+        self._timers: Dict[Tuple[int, int], asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def request(self, hostname: str, count: int, timeout_seconds: int) -> Tuple[Dict[str, Any], int]:
+        """
+        Queue a host for the next fping batch and wait for its statistics.
+
+        Returns:
+            (ping statistics, fping run time in ms); the run time starts when
+            the batch is flushed, so the coalescing delay isn't counted
+        """
+        loop = asyncio.get_running_loop()
+        key = (count, timeout_seconds)
+        batch = self._pending.setdefault(key, {})
+
+        future = batch.get(hostname)
+        if future is None:
+            future = loop.create_future()
+            batch[hostname] = future
+
+            if len(batch) >= self._max_hosts:
+                self._flush(key)
+            elif key not in self._timers:
+                self._timers[key] = loop.call_later(self._delay_seconds, self._flush, key)
+
+        # Shielded so one caller timing out doesn't cancel the result for the others
+        return await asyncio.shield(future)
+
+    def _flush(self, key: Tuple[int, int]) -> None:
+        """Dispatch all pending hosts for a (count, timeout) key"""
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: Tuple[int, int], batch: Dict[str, asyncio.Future]) -> None:
+        """Run fping for a batch of hosts and resolve their futures"""
+        count, timeout_seconds = key
+        start_ns = time.perf_counter_ns()
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                _FPING_BIN, "-C", str(count), "-q", "-i", "10",
+                "-t", str(timeout_seconds * 1000), *batch.keys(),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await process.communicate()
+            stats_by_host = self._parse_fping_output(stderr.decode(errors="replace"), count)
+            run_ms = elapsed_ms(start_ns)
+
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for hostname, future in batch.items():
+            if not future.done():
+                future.set_result((stats_by_host.get(hostname) or self._empty_stats(count), run_ms))
+
+    @staticmethod
+    def _empty_stats(count: int) -> Dict[str, Any]:
+        return {
+            "packets_sent": count,
+            "packets_received": 0,
+            "packet_loss": 100.0,
+            "min_latency": None,
+            "avg_latency": None,
+            "max_latency": None
+        }
+
+    @classmethod
+    def _parse_fping_output(cls, output: str, count: int) -> Dict[str, Dict[str, Any]]:
+        """Parse fping -C output into per-host statistics"""
+        stats_by_host = {}
+
+        for hostname, values in _FPING_LINE_RE.findall(output):
+            rtts = [float(v) for v in values.split() if v != "-"]
+            stats = cls._empty_stats(count)
+
+            if rtts:
+                stats["packets_received"] = len(rtts)
+                stats["packet_loss"] = round((1 - len(rtts) / count) * 100, 2)
+                stats["min_latency"] = min(rtts)
+                stats["avg_latency"] = round(sum(rtts) / len(rtts), 3)
+                stats["max_latency"] = max(rtts)
+
+            stats_by_host[hostname] = stats
+
+        return stats_by_host
+
+
+_ping_batcher = PingBatcher()
+
 
 @register_check
 class PingCheck(BaseCheck):
     """Check that verifies host reachability using ping (ICMP)"""
 
-    @property
-    def check_type(self) -> str:
-        return "ping"
-
-    @property
-    def display_name(self) -> str:
-        return "Ping (ICMP) Check"
-
-    @property
-    def description(self) -> str:
-        return "Verifies host reachability and measures round-trip time using ICMP ping"
+    check_type = "ping"
+    display_name = "Ping (ICMP) Check"
+    description = "Verifies host reachability and measures round-trip time using ICMP ping"
+
+    _CONFIG_SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "count": {
+                "type": "integer",
+                "default": 3,
+                "minimum": 1,
+                "maximum": 10,
+                "description": "Number of ping requests to send"
+            },
+            "timeout_seconds": {
+                "type": "integer",
+                "default": 10,
+                "minimum": 1,
+                "maximum": 30,
+                "description": "Timeout for each ping request"
+            },
+            "max_latency_ms": {
+                "type": "integer",
+                "default": 1000,
+                "minimum": 1,
+                "description": "Maximum acceptable latency in milliseconds (triggers warning if exceeded)"
+            }
+        }
+    }
 
     async def execute(self, site_url: str, config: Dict[str, Any]) -> CheckResult:
         count = config.get("count", 3)
         timeout_seconds = config.get("timeout_seconds", 10)
         max_latency_ms = config.get("max_latency_ms", 1000)
 
-        # Extract hostname from URL
-        parsed = urlparse(site_url)
-        hostname = parsed.netloc or parsed.path
-        # Remove port if present
-        if ":" in hostname:
-            hostname = hostname.split(":")[0]
+        hostname = extract_host(site_url)
+
+        if _PING_BIN is None and _FPING_BIN is None:
+            return CheckResult(
+                status="failure",
+                response_time_ms=0,
+                error_message="Ping command not found on this system",
+                result_data={
+                    "hostname": hostname,
+                    "error_type": "CommandNotFound"
+                }
+            )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            loop = asyncio.get_event_loop()
+            if _FPING_BIN is not None:
+                # Coalesced with other concurrent ping checks into one fping run
+                ping_stats, response_time_ms = await asyncio.wait_for(
+                    _ping_batcher.request(hostname, count, timeout_seconds),
+                    timeout=timeout_seconds + 10
+                )
+                reachable = ping_stats["packets_received"] > 0
 
-            # Build ping command based on OS
-            if platform.system().lower() == "windows":
-                cmd = ["ping", "-n", str(count), "-w", str(timeout_seconds * 1000), hostname]
             else:
-                cmd = ["ping", "-c", str(count), "-W", str(timeout_seconds), hostname]
-
-            # Run ping in executor
-            result = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: subprocess.run(
+                # Build ping command based on OS
+                if platform.system().lower() == "windows":
+                    cmd = [_PING_BIN, "-n", str(count), "-w", str(timeout_seconds * 1000), hostname]
+                else:
+                    cmd = [_PING_BIN, "-c", str(count), "-W", str(timeout_seconds), hostname]
+
+                # Run ping in a worker thread
+                result = await asyncio.wait_for(
+                    asyncio.to_thread(
+                        subprocess.run,
                         cmd,
                         capture_output=True,
                         text=True,
                         timeout=timeout_seconds + 5
-                    )
-                ),
-                timeout=timeout_seconds + 10
-            )
-
-            response_time_ms = int((time.time() - start_time) * 1000)
+                    ),
+                    timeout=timeout_seconds + 10
+                )
 
-            # Parse ping output
-            ping_stats = self._parse_ping_output(result.stdout, platform.system().lower())
+                # Parse ping output
+                ping_stats = self._parse_ping_output(result.stdout, platform.system().lower())
+                reachable = result.returncode == 0 and ping_stats["packets_received"] > 0
+                response_time_ms = elapsed_ms(start_ns)
 
-            if result.returncode != 0 or ping_stats["packets_received"] == 0:
+            if not reachable:
                 return CheckResult(
                     status="failure",
                     response_time_ms=response_time_ms,
@@ -104,7 +257,7 @@ class PingCheck(BaseCheck):
             )
 
         except subprocess.TimeoutExpired:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -116,7 +269,7 @@ class PingCheck(BaseCheck):
             )
 
         except asyncio.TimeoutError:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -128,7 +281,7 @@ class PingCheck(BaseCheck):
             )
 
         except FileNotFoundError:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -140,7 +293,7 @@ class PingCheck(BaseCheck):
             )
 
         except Exception as e:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -183,7 +336,6 @@ class PingCheck(BaseCheck):
 
                 # Try simpler parsing
                 if "transmitted" in line_lower and "received" in line_lower:
-                    import re
                     numbers = re.findall(r'\d+', line)
                     if len(numbers) >= 2:
                         stats["packets_sent"] = int(numbers[0])
@@ -193,7 +345,6 @@ class PingCheck(BaseCheck):
                 # Unix: "rtt min/avg/max/mdev = 10.123/15.456/20.789/3.456 ms"
                 # Windows: "Minimum = 10ms, Maximum = 20ms, Average = 15ms"
                 if "min/avg/max" in line_lower or "rtt" in line_lower:
-                    import re
                     numbers = re.findall(r'[\d.]+', line)
                     if len(numbers) >= 3:
                         stats["min_latency"] = float(numbers[0])
@@ -201,7 +352,6 @@ class PingCheck(BaseCheck):
                         stats["max_latency"] = float(numbers[2])
 
                 if "minimum" in line_lower and "average" in line_lower:
-                    import re
                     numbers = re.findall(r'[\d.]+', line)
                     if len(numbers) >= 3:
                         stats["min_latency"] = float(numbers[0])
@@ -220,28 +370,4 @@ class PingCheck(BaseCheck):
         return stats
 
     def get_config_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "count": {
-                    "type": "integer",
-                    "default": 3,
-                    "minimum": 1,
-                    "maximum": 10,
-                    "description": "Number of ping requests to send"
-                },
-                "timeout_seconds": {
-                    "type": "integer",
-                    "default": 10,
-                    "minimum": 1,
-                    "maximum": 30,
-                    "description": "Timeout for each ping request"
-                },
-                "max_latency_ms": {
-                    "type": "integer",
-                    "default": 1000,
-                    "minimum": 1,
-                    "description": "Maximum acceptable latency in milliseconds (triggers warning if exceeded)"
-                }
-            }
-        }
+        return self._CONFIG_SCHEMA
@@ -1,20 +1,34 @@
-from typing import Dict, Type, List
+import logging
+from typing import Any, Dict, Type, List
 from .base import BaseCheck
 
+logger = logging.getLogger(__name__)
+
 
 class CheckRegistry:
     _checks: Dict[str, Type[BaseCheck]] = {}
+    # Plugins are stateless, so one instance per check type is shared
+    _instances: Dict[str, BaseCheck] = {}
+    # Check metadata is static, so it is built once at registration
+    _metadata: Dict[str, Dict[str, Any]] = {}
 
     @classmethod
     def register(cls, check_class: Type[BaseCheck]) -> None:
-        instance = check_class()
-        check_type = instance.check_type
+        check_type = check_class.check_type
 
         if check_type in cls._checks:
             raise ValueError(f"Check type '{check_type}' is already registered")
 
+        instance = check_class()
         cls._checks[check_type] = check_class
-        print(f"✓ Registered check type: {check_type}")
+        cls._instances[check_type] = instance
+        cls._metadata[check_type] = {
+            "type": check_type,
+            "display_name": check_class.display_name,
+            "description": check_class.description,
+            "config_schema": instance.get_config_schema()
+        }
+        logger.debug("Registered check type: %s", check_type)
 
     @classmethod
     def is_registered(cls, check_type: str) -> bool:
@@ -28,17 +42,15 @@ class CheckRegistry:
         return cls._checks[check_type]
 
     @classmethod
-    def list_checks(cls) -> List[Dict[str, any]]:
-        result = []
-        for check_type, check_class in cls._checks.items():
-            instance = check_class()
-            result.append({
-                "type": check_type,
-                "display_name": instance.display_name,
-                "description": instance.description,
-                "config_schema": instance.get_config_schema()
-            })
-        return result
+    def get_instance(cls, check_type: str) -> BaseCheck:
+        if check_type not in cls._instances:
+            available = ", ".join(cls._instances.keys())
+            raise KeyError(f"Check type '{check_type}' not found. Available: {available}")
+        return cls._instances[check_type]
+
+    @classmethod
+    def list_checks(cls) -> List[Dict[str, Any]]:
+        return list(cls._metadata.values())
 
 
 def register_check(check_class: Type[BaseCheck]) -> Type[BaseCheck]:
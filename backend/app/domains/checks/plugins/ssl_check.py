@@ -1,76 +1,121 @@
 """SSL certificate check plugin"""
 import ssl
-import socket
 import time
 import asyncio
+import functools
 from datetime import datetime, timezone
-from typing import Any, Dict
-from urllib.parse import urlparse
+from typing import Any, Dict, Tuple
 
-from .base import BaseCheck, CheckResult
+from ._tls_probe import probe
+from .base import BaseCheck, CheckResult, elapsed_ms
 from .registry import register_check
 
+# Certificates change rarely, so recent results are reused per (hostname, port).
+# Entries hold (fetched_at monotonic, fetch time in ms, cert info); freshness is
+# judged against each caller's own TTL.
+_CERT_CACHE: Dict[Tuple[str, int], Tuple[float, int, Dict[str, Any]]] = {}
+_MAX_CERT_CACHE = 4096
+# Longest cache_ttl_seconds the config schema allows; older entries are dead
+_MAX_CERT_TTL_SECONDS = 3600
+
+
+def _remember_cert(key: Tuple[str, int], fetch_ms: int, cert_info: Dict[str, Any]) -> None:
+    """Cache a fetched certificate, evicting entries for endpoints no longer checked"""
+    now = time.monotonic()
+    if len(_CERT_CACHE) >= _MAX_CERT_CACHE:
+        for stale in [k for k, (fetched_at, _, _) in _CERT_CACHE.items() if now - fetched_at >= _MAX_CERT_TTL_SECONDS]:
+            del _CERT_CACHE[stale]
+        if len(_CERT_CACHE) >= _MAX_CERT_CACHE:
+            _CERT_CACHE.clear()
+    _CERT_CACHE[key] = (now, fetch_ms, cert_info)
+
+
+@functools.lru_cache(maxsize=4096)
+def _endpoint(site_url: str) -> Tuple[str, int]:
+    """Split a site URL into (hostname, port), defaulting to 443"""
+    rest = site_url.split("://", 1)[-1]
+    hostport = rest.split("/", 1)[0].split("?", 1)[0]
+    hostname, sep, port = hostport.rpartition(":")
+    if sep and port.isdigit():
+        return hostname, int(port)
+    return hostport, 443
+
+
+def _epoch_to_iso(epoch: int) -> str:
+    """Format a POSIX timestamp as a naive UTC ISO string"""
+    return datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None).isoformat()
+
 
 @register_check
 class SSLCheck(BaseCheck):
     """Check that verifies SSL certificate validity and expiration"""
 
-    @property
-    def check_type(self) -> str:
-        return "ssl"
-
-    @property
-    def display_name(self) -> str:
-        return "SSL Certificate Check"
-
-    @property
-    def description(self) -> str:
-        return "Verifies SSL certificate validity and warns before expiration"
+    check_type = "ssl"
+    display_name = "SSL Certificate Check"
+    description = "Verifies SSL certificate validity and warns before expiration"
+
+    _CONFIG_SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "warning_days_before_expiry": {
+                "type": "integer",
+                "default": 30,
+                "minimum": 1,
+                "maximum": 365,
+                "description": "Days before expiry to trigger warning"
+            },
+            "timeout_seconds": {
+                "type": "integer",
+                "default": 10,
+                "minimum": 1,
+                "maximum": 60,
+                "description": "Connection timeout in seconds"
+            },
+            "cache_ttl_seconds": {
+                "type": "integer",
+                "default": 300,
+                "minimum": 0,
+                "maximum": 3600,
+                "description": "Seconds to reuse a fetched certificate (0 disables caching)"
+            }
+        }
+    }
 
     async def execute(self, site_url: str, config: Dict[str, Any]) -> CheckResult:
         warning_days = config.get("warning_days_before_expiry", 30)
         timeout_seconds = config.get("timeout_seconds", 10)
+        cache_ttl = config.get("cache_ttl_seconds", 300)
 
-        # Extract hostname and port
-        parsed = urlparse(site_url)
-        hostname = parsed.netloc or parsed.path
-        port = parsed.port or 443
+        hostname, port = _endpoint(site_url)
 
-        # Remove port from hostname if present
-        if ":" in hostname:
-            hostname = hostname.split(":")[0]
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            loop = asyncio.get_event_loop()
-
-            # Get certificate info in executor (blocking operation)
-            cert_info = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: self._get_certificate_info(hostname, port, timeout_seconds)
-                ),
-                timeout=timeout_seconds + 5
-            )
-
-            response_time_ms = int((time.time() - start_time) * 1000)
-
-            # Parse dates
-            not_after = datetime.strptime(cert_info["not_after"], "%b %d %H:%M:%S %Y %Z")
-            not_before = datetime.strptime(cert_info["not_before"], "%b %d %H:%M:%S %Y %Z")
+            cached = _CERT_CACHE.get((hostname, port))
+            if cached and time.monotonic() - cached[0] < cache_ttl:
+                # Report the original fetch time so cache hits don't skew latency
+                _, response_time_ms, cert_info = cached
+                from_cache = True
+            else:
+                cert_info = await self._get_certificate_info(hostname, port, timeout_seconds)
+                response_time_ms = elapsed_ms(start_ns)
+                from_cache = False
+                if cache_ttl > 0:
+                    _remember_cert((hostname, port), response_time_ms, cert_info)
 
-            now = datetime.now(timezone.utc).replace(tzinfo=None)
-            days_until_expiry = (not_after - now).days
+            not_after_epoch = cert_info["not_after_epoch"]
+            days_until_expiry = (not_after_epoch - int(time.time())) // 86400
 
             result_data = {
                 "hostname": hostname,
                 "issuer": cert_info["issuer"],
                 "subject": cert_info["subject"],
-                "not_before": not_before.isoformat(),
-                "not_after": not_after.isoformat(),
+                "not_before": _epoch_to_iso(cert_info["not_before_epoch"]),
+                "not_after": _epoch_to_iso(not_after_epoch),
                 "days_until_expiry": days_until_expiry,
-                "serial_number": cert_info.get("serial_number", "Unknown")
+                "serial_number": cert_info.get("serial_number", "Unknown"),
+                "tls_version": cert_info.get("tls_version"),
+                "cached": from_cache
             }
 
             # Check expiration
@@ -96,7 +141,7 @@ class SSLCheck(BaseCheck):
                 )
 
         except ssl.SSLCertVerificationError as e:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -107,24 +152,12 @@ class SSLCheck(BaseCheck):
                 }
             )
 
-        except socket.timeout:
-            response_time_ms = int((time.time() - start_time) * 1000)
-            return CheckResult(
-                status="failure",
-                response_time_ms=response_time_ms,
-                error_message=f"Connection timed out after {timeout_seconds}s",
-                result_data={
-                    "hostname": hostname,
-                    "timeout": timeout_seconds
-                }
-            )
-
         except asyncio.TimeoutError:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
-                error_message=f"Operation timed out after {timeout_seconds}s",
+                error_message=f"Connection timed out after {timeout_seconds}s",
                 result_data={
                     "hostname": hostname,
                     "timeout": timeout_seconds
@@ -132,7 +165,7 @@ class SSLCheck(BaseCheck):
             )
 
         except Exception as e:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = elapsed_ms(start_ns)
             return CheckResult(
                 status="failure",
                 response_time_ms=response_time_ms,
@@ -143,51 +176,23 @@ class SSLCheck(BaseCheck):
                 }
             )
 
-    def _get_certificate_info(self, hostname: str, port: int, timeout: int) -> Dict[str, Any]:
-        """Get SSL certificate information (blocking)"""
-        context = ssl.create_default_context()
-
-        with socket.create_connection((hostname, port), timeout=timeout) as sock:
-            with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                cert = ssock.getpeercert()
-
-        # Extract subject info
-        subject = {}
-        for item in cert.get("subject", []):
-            for key, value in item:
-                subject[key] = value
+    async def _get_certificate_info(self, hostname: str, port: int, timeout: int) -> Dict[str, Any]:
+        """Get SSL certificate information from a shared TLS probe"""
+        result = await probe(hostname, port, timeout)
+        cert = result.peercert
 
-        # Extract issuer info
-        issuer = {}
-        for item in cert.get("issuer", []):
-            for key, value in item:
-                issuer[key] = value
+        # Flatten the RDN sequences into {attribute: value}
+        subject = {key: value for rdn in cert.get("subject", ()) for key, value in rdn}
+        issuer = {key: value for rdn in cert.get("issuer", ()) for key, value in rdn}
 
         return {
             "subject": subject.get("commonName", "Unknown"),
             "issuer": issuer.get("organizationName", issuer.get("commonName", "Unknown")),
-            "not_before": cert.get("notBefore", ""),
-            "not_after": cert.get("notAfter", ""),
-            "serial_number": cert.get("serialNumber", "Unknown")
+            "not_before_epoch": ssl.cert_time_to_seconds(cert["notBefore"]),
+            "not_after_epoch": ssl.cert_time_to_seconds(cert["notAfter"]),
+            "serial_number": cert.get("serialNumber", "Unknown"),
+            "tls_version": result.tls_version
         }
 
     def get_config_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "warning_days_before_expiry": {
-                    "type": "integer",
-                    "default": 30,
-                    "minimum": 1,
-                    "maximum": 365,
-                    "description": "Days before expiry to trigger warning"
-                },
-                "timeout_seconds": {
-                    "type": "integer",
-                    "default": 10,
-                    "minimum": 1,
-                    "maximum": 60,
-                    "description": "Connection timeout in seconds"
-                }
-            }
-        }
+        return self._CONFIG_SCHEMA
@@ -1,8 +1,13 @@
 """Notifications domain API routes"""
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, select, tuple_, update
 from typing import List, Optional
+from datetime import datetime
 
 from app.core.database import get_db
 from app.core.security import get_current_user
@@ -24,29 +29,82 @@ from .service import NotificationService
 
 router = APIRouter()
 
+# Upper bound on a channel test so a slow SMTP/webhook endpoint can't pin the request
+TEST_CHANNEL_TIMEOUT_SECONDS = 10
+
+
+# List endpoints return at most this many items per page
+MAX_PAGE_SIZE = 500
+
+# Response header carrying the query string for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _seek_page(query, model, limit: int, before_created_at: Optional[datetime], before_id: Optional[int]):
+    """
+    Apply newest-first keyset pagination to a list query.
+
+    Seeks past the previous page instead of using OFFSET; the cursor is the
+    (created_at, id) of the last item received, and both halves are required.
+    """
+    if (before_created_at is None) != (before_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="before_created_at and before_id must be sent together"
+        )
+    if before_id is not None:
+        query = query.where(tuple_(model.created_at, model.id) < (before_created_at, before_id))
+    return query.order_by(model.created_at.desc(), model.id.desc()).limit(limit)
+
+
+def _set_next_cursor(response: Response, items: list, limit: int) -> None:
+    """Point the client at the next page when this one came back full"""
+    if len(items) == limit:
+        last = items[-1]
+        response.headers[NEXT_CURSOR_HEADER] = urlencode({
+            "before_created_at": last.created_at.isoformat(),
+            "before_id": last.id,
+        })
+
 
 # ============ Channel Types ============
 
 @router.get("/channel-types", response_model=List[ChannelTypeInfo])
 async def list_channel_types():
     """List all available notification channel types with their configuration schemas"""
-    return ChannelRegistry.list_channels()
+    # The schemas never change at runtime, so the body is serialized once and reused
+    return Response(content=ChannelRegistry.list_channels_json(), media_type="application/json")
 
 
 # ============ Channels CRUD ============
 
 @router.get("/channels", response_model=List[NotificationChannelResponse])
 async def list_channels(
+    response: Response,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[int] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """List all notification channels for the current user's organization"""
-    result = await db.execute(
-        select(NotificationChannel)
-        .where(NotificationChannel.organization_id == current_user.organization_id)
-        .order_by(NotificationChannel.created_at.desc())
+    """
+    List notification channels for the current user's organization, newest first.
+
+    When the page is full, the X-Next-Cursor header holds the query
+    parameters (before_created_at and before_id) that fetch the next one.
+    """
+    query = _seek_page(
+        select(NotificationChannel).where(NotificationChannel.organization_id == current_user.organization_id),
+        NotificationChannel,
+        limit,
+        before_created_at,
+        before_id,
     )
-    return result.scalars().all()
+
+    result = await db.execute(query)
+    items = result.scalars().all()
+    _set_next_cursor(response, items, limit)
+    return items
 
 
 @router.post("/channels", response_model=NotificationChannelResponse, status_code=status.HTTP_201_CREATED)
@@ -63,6 +121,13 @@ async def create_channel(
             detail=f"Invalid channel type: {channel_data.channel_type}"
         )
 
+    errors = ChannelRegistry.validate_config(channel_data.channel_type.value, channel_data.configuration)
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid configuration: {'; '.join(errors)}"
+        )
+
     # Create channel
     channel = NotificationChannel(
         **channel_data.model_dump(),
@@ -107,27 +172,43 @@ async def update_channel(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a notification channel"""
-    result = await db.execute(
-        select(NotificationChannel).where(
-            NotificationChannel.id == channel_id,
-            NotificationChannel.organization_id == current_user.organization_id
-        )
+    criteria = (
+        NotificationChannel.id == channel_id,
+        NotificationChannel.organization_id == current_user.organization_id
     )
-    channel = result.scalar_one_or_none()
 
-    if not channel:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Channel not found"
-        )
+    channel_not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Channel not found"
+    )
 
-    # Update fields
+    # Validate a new configuration against the channel's type before writing it
     update_data = channel_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(channel, field, value)
+    if "configuration" in update_data:
+        channel_type = await db.scalar(select(NotificationChannel.channel_type).where(*criteria))
+        if channel_type is None:
+            raise channel_not_found
+
+        errors = ChannelRegistry.validate_config(channel_type.value, update_data["configuration"])
+        if errors:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid configuration: {'; '.join(errors)}"
+            )
+
+    # Update and fetch the row in one round trip
+    if update_data:
+        query = update(NotificationChannel).where(*criteria).values(**update_data).returning(NotificationChannel)
+    else:
+        query = select(NotificationChannel).where(*criteria)
+
+    result = await db.execute(query)
+    channel = result.scalar_one_or_none()
+
+    if not channel:
+        raise channel_not_found
 
     await db.commit()
-    await db.refresh(channel)
 
     return channel
 
@@ -139,22 +220,24 @@ async def delete_channel(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a notification channel"""
+    # Rules and logs are removed by the ON DELETE CASCADE foreign keys
     result = await db.execute(
-        select(NotificationChannel).where(
+        delete(NotificationChannel)
+        .where(
             NotificationChannel.id == channel_id,
             NotificationChannel.organization_id == current_user.organization_id
         )
+        .execution_options(synchronize_session=False)
     )
-    channel = result.scalar_one_or_none()
 
-    if not channel:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Channel not found"
         )
 
-    await db.delete(channel)
     await db.commit()
+    NotificationService.invalidate_rule_cache(current_user.organization_id)
 
     return None
 
@@ -181,11 +264,19 @@ async def test_channel(
         )
 
     try:
-        success = await NotificationService.send_test_notification(db, channel)
+        success = await asyncio.wait_for(
+            NotificationService.send_test_notification(db, channel),
+            timeout=TEST_CHANNEL_TIMEOUT_SECONDS
+        )
         return TestConnectionResponse(
             success=success,
             message="Connection test successful"
         )
+    except asyncio.TimeoutError:
+        return TestConnectionResponse(
+            success=False,
+            message=f"Connection test timed out after {TEST_CHANNEL_TIMEOUT_SECONDS}s"
+        )
     except Exception as e:
         return TestConnectionResponse(
             success=False,
@@ -197,16 +288,31 @@ async def test_channel(
 
 @router.get("/rules", response_model=List[NotificationRuleResponse])
 async def list_rules(
+    response: Response,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[int] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """List all notification rules for the current user's organization"""
-    result = await db.execute(
-        select(NotificationRule)
-        .where(NotificationRule.organization_id == current_user.organization_id)
-        .order_by(NotificationRule.created_at.desc())
+    """
+    List notification rules for the current user's organization, newest first.
+
+    When the page is full, the X-Next-Cursor header holds the query
+    parameters (before_created_at and before_id) that fetch the next one.
+    """
+    query = _seek_page(
+        select(NotificationRule).where(NotificationRule.organization_id == current_user.organization_id),
+        NotificationRule,
+        limit,
+        before_created_at,
+        before_id,
     )
-    return result.scalars().all()
+
+    result = await db.execute(query)
+    items = result.scalars().all()
+    _set_next_cursor(response, items, limit)
+    return items
 
 
 @router.post("/rules", response_model=NotificationRuleResponse, status_code=status.HTTP_201_CREATED)
@@ -217,13 +323,13 @@ async def create_rule(
 ):
     """Create a new notification rule"""
     # Verify channel exists and belongs to org
-    channel_result = await db.execute(
-        select(NotificationChannel).where(
+    channel_id = await db.scalar(
+        select(NotificationChannel.id).where(
             NotificationChannel.id == rule_data.channel_id,
             NotificationChannel.organization_id == current_user.organization_id
         )
     )
-    if not channel_result.scalar_one_or_none():
+    if channel_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Channel not found"
@@ -237,6 +343,7 @@ async def create_rule(
     db.add(rule)
     await db.commit()
     await db.refresh(rule)
+    NotificationService.invalidate_rule_cache(current_user.organization_id)
 
     return rule
 
@@ -273,41 +380,48 @@ async def update_rule(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a notification rule"""
-    result = await db.execute(
-        select(NotificationRule).where(
-            NotificationRule.id == rule_id,
-            NotificationRule.organization_id == current_user.organization_id
-        )
+    criteria = (
+        NotificationRule.id == rule_id,
+        NotificationRule.organization_id == current_user.organization_id
+    )
+    rule_not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Rule not found"
     )
-    rule = result.scalar_one_or_none()
-
-    if not rule:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Rule not found"
-        )
 
-    # If channel_id is being updated, verify it exists
+    # If channel_id is being updated, verify it exists; a missing rule is
+    # reported first so channel ids aren't probed through other orgs' rules
     update_data = rule_data.model_dump(exclude_unset=True)
     if "channel_id" in update_data:
-        channel_result = await db.execute(
-            select(NotificationChannel).where(
+        if await db.scalar(select(NotificationRule.id).where(*criteria)) is None:
+            raise rule_not_found
+
+        channel_id = await db.scalar(
+            select(NotificationChannel.id).where(
                 NotificationChannel.id == update_data["channel_id"],
                 NotificationChannel.organization_id == current_user.organization_id
             )
         )
-        if not channel_result.scalar_one_or_none():
+        if channel_id is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Channel not found"
             )
 
-    # Update fields
-    for field, value in update_data.items():
-        setattr(rule, field, value)
+    # Update and fetch the row in one round trip
+    if update_data:
+        query = update(NotificationRule).where(*criteria).values(**update_data).returning(NotificationRule)
+    else:
+        query = select(NotificationRule).where(*criteria)
+
+    result = await db.execute(query)
+    rule = result.scalar_one_or_none()
+
+    if not rule:
+        raise rule_not_found
 
     await db.commit()
-    await db.refresh(rule)
+    NotificationService.invalidate_rule_cache(current_user.organization_id)
 
     return rule
 
@@ -319,22 +433,24 @@ async def delete_rule(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a notification rule"""
+    # Logs are removed by the ON DELETE CASCADE foreign key
     result = await db.execute(
-        select(NotificationRule).where(
+        delete(NotificationRule)
+        .where(
             NotificationRule.id == rule_id,
             NotificationRule.organization_id == current_user.organization_id
         )
+        .execution_options(synchronize_session=False)
     )
-    rule = result.scalar_one_or_none()
 
-    if not rule:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Rule not found"
         )
 
-    await db.delete(rule)
     await db.commit()
+    NotificationService.invalidate_rule_cache(current_user.organization_id)
 
     return None
 
@@ -349,8 +465,17 @@ async def list_logs(
     db: AsyncSession = Depends(get_db)
 ):
     """List notification logs for the current user's organization"""
+    # Select plain columns: log rows are read-only here, so ORM hydration is wasted work
     query = (
-        select(NotificationLog)
+        select(
+            NotificationLog.id,
+            NotificationLog.rule_id,
+            NotificationLog.check_result_id,
+            NotificationLog.incident_id,
+            NotificationLog.status,
+            NotificationLog.error_message,
+            NotificationLog.sent_at,
+        )
         .join(NotificationRule)
         .where(NotificationRule.organization_id == current_user.organization_id)
     )
@@ -361,4 +486,4 @@ async def list_logs(
     query = query.order_by(NotificationLog.sent_at.desc()).limit(limit)
 
     result = await db.execute(query)
-    return result.scalars().all()
+    return [dict(row) for row in result.mappings()]
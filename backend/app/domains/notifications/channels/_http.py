@@ -0,0 +1,37 @@
+"""Shared HTTP client for notification channels"""
+from typing import Optional
+
+import httpx
+
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    An outage can fan out many alerts to the same webhook host; a pooled client
+    lets them reuse one connection instead of each paying a TCP/TLS handshake,
+    and HTTP/2 lets concurrent alerts multiplex over it. Hosts without HTTP/2
+    fall back to HTTP/1.1 during ALPN negotiation.
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60,
+            ),
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)"""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
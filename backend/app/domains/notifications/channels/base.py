@@ -1,8 +1,8 @@
 """Base class for notification channels"""
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class NotificationPayload(BaseModel):
@@ -18,6 +18,26 @@ class NotificationPayload(BaseModel):
     checked_at: datetime = Field(..., description="Timestamp of the check")
     incident_id: Optional[int] = Field(None, description="Related incident ID if any")
 
+    # One payload fans out to every matching channel; freezing it keeps
+    # channels from mutating each other's input and makes it hashable
+    model_config = ConfigDict(frozen=True)
+
+    # Derived values live outside the field __dict__, which frozen models
+    # hash on, so computing them never changes the payload's hash
+    _json_body: Optional[bytes] = PrivateAttr(default=None)
+
+    @property
+    def checked_at_display(self) -> str:
+        """Check timestamp formatted for humans"""
+        return self.checked_at.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+    @property
+    def json_body(self) -> bytes:
+        """Payload serialized to JSON, computed once and shared by every channel"""
+        if self._json_body is None:
+            self._json_body = self.model_dump_json().encode()
+        return self._json_body
+
 
 class BaseNotificationChannel(ABC):
     """Abstract base class for notification channels"""
@@ -35,7 +55,7 @@ class BaseNotificationChannel(ABC):
         pass
 
     @abstractmethod
-    async def send(self, config: Dict[str, Any], payload: NotificationPayload) -> bool:
+    async def send(self, config: dict[str, Any], payload: NotificationPayload) -> bool:
         """
         Send a notification.
 
@@ -49,7 +69,7 @@ class BaseNotificationChannel(ABC):
         pass
 
     @abstractmethod
-    def get_config_schema(self) -> Dict[str, Any]:
+    def get_config_schema(self) -> dict[str, Any]:
         """
         Return JSON schema for channel configuration.
 
@@ -59,7 +79,7 @@ class BaseNotificationChannel(ABC):
         pass
 
     @abstractmethod
-    async def test_connection(self, config: Dict[str, Any]) -> bool:
+    async def test_connection(self, config: dict[str, Any]) -> bool:
         """
         Test if the channel configuration is valid.
 
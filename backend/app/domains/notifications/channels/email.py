@@ -1,12 +1,109 @@
 """Email notification channel using SMTP"""
+import asyncio
+import functools
+import time
 import aiosmtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Any, Dict
+from email.message import EmailMessage
+from typing import Any
 
 from .base import BaseNotificationChannel, NotificationPayload
 from .registry import register_channel
 
+# Open SMTP sessions reused across alerts, keyed by server and credentials.
+# Each key has a lock because an SMTP session carries one transaction at a time.
+SMTPKey = tuple[str, int, str, str, bool]
+_SMTP_POOL: dict[SMTPKey, aiosmtplib.SMTP] = {}
+_SMTP_LOCKS: dict[SMTPKey, asyncio.Lock] = {}
+# When each pooled session last completed a command (monotonic seconds)
+_SMTP_LAST_USED: dict[SMTPKey, float] = {}
+
+# Sessions idle longer than this are checked with NOOP before reuse, since
+# servers commonly drop idle clients after a minute or so
+SMTP_IDLE_CHECK_SECONDS = 60
+
+
+async def close_smtp_connections() -> None:
+    """Close pooled SMTP sessions (called on application shutdown)"""
+    for smtp in list(_SMTP_POOL.values()):
+        if smtp.is_connected:
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException:
+                smtp.close()
+    _SMTP_POOL.clear()
+    _SMTP_LAST_USED.clear()
+
+
+# Subject line prefixes per check status and trigger
+_STATUS_EMOJI = {
+    "failure": "🔴",
+    "warning": "🟡",
+    "success": "🟢",
+}
+
+_TRIGGER_LABELS = {
+    "check_failure": "ALERT",
+    "check_recovery": "RECOVERED",
+    "incident_opened": "INCIDENT",
+    "incident_resolved": "RESOLVED",
+}
+
+# Single-pass HTML escaping for payload text interpolated into the email body
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def _esc(value: str) -> str:
+    """Escape text for safe inclusion in HTML"""
+    return value.translate(_HTML_ESCAPE)
+
+
+# Plain text body lines present in every notification
+_TEXT_TEMPLATE = (
+    "Site: {site_name}\n"
+    "URL: {site_url}\n"
+    "Check: {check_name} ({check_type})\n"
+    "Status: {status}\n"
+    "Time: {time}"
+)
+
+# Header colour per check status
+_STATUS_COLORS = {
+    "failure": "#dc2626",
+    "warning": "#f59e0b",
+    "success": "#16a34a",
+}
+
+# Static HTML around the per-notification content, built once at import
+_HTML_HEAD = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }
+                .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+                .header { color: white; padding: 20px; border-radius: 8px 8px 0 0; }
+                .content { background: #f9fafb; padding: 20px; border-radius: 0 0 8px 8px; }
+                .label { color: #6b7280; font-size: 12px; text-transform: uppercase; }
+                .value { font-size: 16px; margin-bottom: 16px; }
+                .error { background: #fef2f2; border-left: 4px solid #dc2626; padding: 12px; margin-top: 16px; }
+            </style>
+        </head>
+        <body>
+            <div class="container">"""
+
+_HTML_TAIL = """
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
 
 @register_channel
 class EmailChannel(BaseNotificationChannel):
@@ -20,90 +117,133 @@ class EmailChannel(BaseNotificationChannel):
     def display_name(self) -> str:
         return "Email (SMTP)"
 
-    async def send(self, config: Dict[str, Any], payload: NotificationPayload) -> bool:
+    _CONFIG_SCHEMA: dict[str, Any] = {
+        "type": "object",
+        "required": ["smtp_host", "from_address", "to_addresses"],
+        "properties": {
+            "smtp_host": {
+                "type": "string",
+                "title": "SMTP Host",
+                "description": "SMTP server hostname"
+            },
+            "smtp_port": {
+                "type": "integer",
+                "default": 587,
+                "title": "SMTP Port",
+                "description": "SMTP server port"
+            },
+            "smtp_user": {
+                "type": "string",
+                "title": "SMTP Username",
+                "description": "Username for SMTP authentication"
+            },
+            "smtp_password": {
+                "type": "string",
+                "title": "SMTP Password",
+                "format": "password",
+                "description": "Password for SMTP authentication"
+            },
+            "from_address": {
+                "type": "string",
+                "format": "email",
+                "title": "From Address",
+                "description": "Email address to send from"
+            },
+            "to_addresses": {
+                "type": "array",
+                "items": {"type": "string", "format": "email"},
+                "title": "Recipients",
+                "description": "Email addresses to send notifications to"
+            },
+            "use_tls": {
+                "type": "boolean",
+                "default": True,
+                "title": "Use TLS",
+                "description": "Use STARTTLS for secure connection"
+            }
+        }
+    }
+
+    async def send(self, config: dict[str, Any], payload: NotificationPayload) -> bool:
         """Send email notification"""
-        # Build email message
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = self._build_subject(payload)
+        # Build email message (multipart/alternative: plain text first, HTML preferred)
+        msg = EmailMessage()
+        subject, text_body, html_body = self._render(payload)
+        msg["Subject"] = subject
         msg["From"] = config.get("from_address")
         msg["To"] = ", ".join(config.get("to_addresses", []))
 
-        # Build HTML body
-        html_body = self._build_html_body(payload)
-        text_body = self._build_text_body(payload)
-
-        msg.attach(MIMEText(text_body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
+        msg.set_content(text_body)
+        msg.add_alternative(html_body, subtype="html")
 
-        # Send via SMTP
-        smtp_config = {
-            "hostname": config.get("smtp_host"),
-            "port": config.get("smtp_port", 587),
-            "username": config.get("smtp_user"),
-            "password": config.get("smtp_password"),
-            "start_tls": config.get("use_tls", True),
-        }
-
-        await aiosmtplib.send(
-            msg,
-            hostname=smtp_config["hostname"],
-            port=smtp_config["port"],
-            username=smtp_config["username"],
-            password=smtp_config["password"],
-            start_tls=smtp_config["start_tls"],
+        # Send over a pooled SMTP session, reconnecting once if the server dropped it
+        key: SMTPKey = (
+            config.get("smtp_host"),
+            config.get("smtp_port", 587),
+            config.get("smtp_user") or "",
+            config.get("smtp_password") or "",
+            config.get("use_tls", True),
         )
+        lock = _SMTP_LOCKS.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            smtp = _SMTP_POOL.get(key)
+            if smtp is not None and smtp.is_connected:
+                smtp = await self._keepalive(key, smtp)
+            else:
+                smtp = await self._connect(key)
+
+            try:
+                try:
+                    await smtp.send_message(msg)
+                except aiosmtplib.SMTPServerDisconnected:
+                    smtp = await self._connect(key)
+                    await smtp.send_message(msg)
+            except Exception:
+                # Don't reuse a session left mid-transaction, including one
+                # opened for the retry
+                try:
+                    smtp.close()
+                finally:
+                    _SMTP_POOL.pop(key, None)
+                    _SMTP_LAST_USED.pop(key, None)
+                raise
+
+            _SMTP_LAST_USED[key] = time.monotonic()
 
         return True
 
-    def get_config_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "required": ["smtp_host", "from_address", "to_addresses"],
-            "properties": {
-                "smtp_host": {
-                    "type": "string",
-                    "title": "SMTP Host",
-                    "description": "SMTP server hostname"
-                },
-                "smtp_port": {
-                    "type": "integer",
-                    "default": 587,
-                    "title": "SMTP Port",
-                    "description": "SMTP server port"
-                },
-                "smtp_user": {
-                    "type": "string",
-                    "title": "SMTP Username",
-                    "description": "Username for SMTP authentication"
-                },
-                "smtp_password": {
-                    "type": "string",
-                    "title": "SMTP Password",
-                    "format": "password",
-                    "description": "Password for SMTP authentication"
-                },
-                "from_address": {
-                    "type": "string",
-                    "format": "email",
-                    "title": "From Address",
-                    "description": "Email address to send from"
-                },
-                "to_addresses": {
-                    "type": "array",
-                    "items": {"type": "string", "format": "email"},
-                    "title": "Recipients",
-                    "description": "Email addresses to send notifications to"
-                },
-                "use_tls": {
-                    "type": "boolean",
-                    "default": True,
-                    "title": "Use TLS",
-                    "description": "Use STARTTLS for secure connection"
-                }
-            }
-        }
+    async def _keepalive(self, key: SMTPKey, smtp: aiosmtplib.SMTP) -> aiosmtplib.SMTP:
+        """Confirm a long-idle pooled session still works, reconnecting if the server dropped it"""
+        if time.monotonic() - _SMTP_LAST_USED.get(key, 0.0) < SMTP_IDLE_CHECK_SECONDS:
+            return smtp
+        try:
+            await smtp.noop()
+        except aiosmtplib.SMTPException:
+            smtp.close()
+            return await self._connect(key)
+        _SMTP_LAST_USED[key] = time.monotonic()
+        return smtp
+
+    async def _connect(self, key: SMTPKey) -> aiosmtplib.SMTP:
+        """Open an SMTP session (STARTTLS and login happen on connect) and pool it"""
+        hostname, port, username, password, start_tls = key
+        smtp = aiosmtplib.SMTP(
+            hostname=hostname,
+            port=port,
+            username=username or None,
+            password=password or None,
+            start_tls=start_tls,
+        )
+        await smtp.connect()
+        _SMTP_POOL[key] = smtp
+        _SMTP_LAST_USED[key] = time.monotonic()
+        return smtp
+
+    def get_config_schema(self) -> dict[str, Any]:
+        return self._CONFIG_SCHEMA
 
-    async def test_connection(self, config: Dict[str, Any]) -> bool:
+    async def test_connection(self, config: dict[str, Any]) -> bool:
         """Test SMTP connection without sending"""
         smtp = aiosmtplib.SMTP(
             hostname=config.get("smtp_host"),
@@ -124,101 +264,91 @@ class EmailChannel(BaseNotificationChannel):
         await smtp.quit()
         return True
 
-    def _build_subject(self, payload: NotificationPayload) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _render(payload: NotificationPayload) -> tuple[str, str, str]:
+        """
+        Render subject, text and HTML bodies for a payload.
+
+        Cached because one event fans out to every matching rule, so several
+        email channels (or a retried send) render the same frozen payload.
+        """
+        return (
+            EmailChannel._build_subject(payload),
+            EmailChannel._build_text_body(payload),
+            EmailChannel._build_html_body(payload),
+        )
+
+    @staticmethod
+    def _build_subject(payload: NotificationPayload) -> str:
         """Build email subject line"""
-        status_emoji = {
-            "failure": "🔴",
-            "warning": "🟡",
-            "success": "🟢",
-        }.get(payload.status, "⚪")
-
-        trigger_label = {
-            "check_failure": "ALERT",
-            "check_recovery": "RECOVERED",
-            "incident_opened": "INCIDENT",
-            "incident_resolved": "RESOLVED",
-        }.get(payload.trigger, payload.trigger.upper())
+        status_emoji = _STATUS_EMOJI.get(payload.status, "⚪")
+        trigger_label = _TRIGGER_LABELS.get(payload.trigger) or payload.trigger.upper()
 
         return f"{status_emoji} [{trigger_label}] {payload.site_name} - {payload.check_name}"
 
-    def _build_text_body(self, payload: NotificationPayload) -> str:
+    @staticmethod
+    def _build_text_body(payload: NotificationPayload) -> str:
         """Build plain text email body"""
-        lines = [
-            f"Site: {payload.site_name}",
-            f"URL: {payload.site_url}",
-            f"Check: {payload.check_name} ({payload.check_type})",
-            f"Status: {payload.status.upper()}",
-            f"Time: {payload.checked_at.strftime('%Y-%m-%d %H:%M:%S UTC')}",
-        ]
+        text = _TEXT_TEMPLATE.format(
+            site_name=payload.site_name,
+            site_url=payload.site_url,
+            check_name=payload.check_name,
+            check_type=payload.check_type,
+            status=payload.status.upper(),
+            time=payload.checked_at_display,
+        )
 
+        # Optional trailing fields
         if payload.response_time_ms:
-            lines.append(f"Response Time: {payload.response_time_ms}ms")
+            text += f"\nResponse Time: {payload.response_time_ms}ms"
 
         if payload.error_message:
-            lines.append(f"\nError: {payload.error_message}")
+            text += f"\n\nError: {payload.error_message}"
 
         if payload.incident_id:
-            lines.append(f"\nIncident ID: {payload.incident_id}")
+            text += f"\n\nIncident ID: {payload.incident_id}"
 
-        return "\n".join(lines)
+        return text
 
-    def _build_html_body(self, payload: NotificationPayload) -> str:
+    @staticmethod
+    def _build_html_body(payload: NotificationPayload) -> str:
         """Build HTML email body"""
-        status_color = {
-            "failure": "#dc2626",
-            "warning": "#f59e0b",
-            "success": "#16a34a",
-        }.get(payload.status, "#6b7280")
-
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: {status_color}; color: white; padding: 20px; border-radius: 8px 8px 0 0; }}
-                .content {{ background: #f9fafb; padding: 20px; border-radius: 0 0 8px 8px; }}
-                .label {{ color: #6b7280; font-size: 12px; text-transform: uppercase; }}
-                .value {{ font-size: 16px; margin-bottom: 16px; }}
-                .error {{ background: #fef2f2; border-left: 4px solid #dc2626; padding: 12px; margin-top: 16px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2 style="margin: 0;">{payload.site_name}</h2>
-                    <p style="margin: 8px 0 0 0; opacity: 0.9;">{payload.check_name} - {payload.status.upper()}</p>
+        status_color = _STATUS_COLORS.get(payload.status, "#6b7280")
+        site_url = _esc(payload.site_url)
+
+        parts = [
+            _HTML_HEAD,
+            f'''
+                <div class="header" style="background: {status_color};">
+                    <h2 style="margin: 0;">{_esc(payload.site_name)}</h2>
+                    <p style="margin: 8px 0 0 0; opacity: 0.9;">{_esc(payload.check_name)} - {_esc(payload.status.upper())}</p>
                 </div>
                 <div class="content">
                     <div class="label">Site URL</div>
-                    <div class="value"><a href="{payload.site_url}">{payload.site_url}</a></div>
+                    <div class="value"><a href="{site_url}">{site_url}</a></div>
 
                     <div class="label">Check Type</div>
-                    <div class="value">{payload.check_type}</div>
+                    <div class="value">{_esc(payload.check_type)}</div>
 
                     <div class="label">Time</div>
-                    <div class="value">{payload.checked_at.strftime('%Y-%m-%d %H:%M:%S UTC')}</div>
-        """
+                    <div class="value">{payload.checked_at_display}</div>
+        ''',
+        ]
 
         if payload.response_time_ms:
-            html += f"""
+            parts.append(f'''
                     <div class="label">Response Time</div>
                     <div class="value">{payload.response_time_ms}ms</div>
-            """
+            ''')
 
         if payload.error_message:
-            html += f"""
+            parts.append(f'''
                     <div class="error">
-                        <strong>Error:</strong> {payload.error_message}
+                        <strong>Error:</strong> {_esc(payload.error_message)}
                     </div>
-            """
+            ''')
 
-        html += """
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        parts.append(_HTML_TAIL)
 
-        return html
+        return "".join(parts)
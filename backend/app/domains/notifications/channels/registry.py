@@ -1,14 +1,90 @@
 """Registry for notification channels"""
-from typing import Dict, Type, List, Any
+import importlib
+import json
+import logging
+from typing import Any, Callable
 from .base import BaseNotificationChannel
 
+logger = logging.getLogger(__name__)
+
+ConfigValidator = Callable[[dict[str, Any]], list[str]]
+
+# JSON schema type names mapped to the Python types json.loads produces
+_JSON_TYPES: dict[str, tuple] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+
+def _compile_validator(schema: dict[str, Any]) -> ConfigValidator:
+    """
+    Build a config validator from a channel's JSON schema.
+
+    Only required keys and top-level property types are enforced, which is
+    what the built-in channel schemas describe.
+    """
+    required = tuple(schema.get("required", ()))
+    types = {
+        name: _JSON_TYPES[prop["type"]]
+        for name, prop in schema.get("properties", {}).items()
+        if prop.get("type") in _JSON_TYPES
+    }
+
+    def validate(config: dict[str, Any]) -> list[str]:
+        errors = [f"'{name}' is required" for name in required if config.get(name) in (None, "")]
+        for name, value in config.items():
+            expected = types.get(name)
+            if expected is None or value is None:
+                continue
+            # bool is a subclass of int, but JSON keeps them distinct
+            if not isinstance(value, expected) or (isinstance(value, bool) and bool not in expected):
+                errors.append(f"'{name}' has the wrong type")
+        return errors
+
+    return validate
+
 
 class ChannelRegistry:
     """Registry for notification channel implementations"""
-    _channels: Dict[str, Type[BaseNotificationChannel]] = {}
+    _channels: dict[str, type[BaseNotificationChannel]] = {}
+    # Channels are stateless, so one instance per channel type is shared
+    _instances: dict[str, BaseNotificationChannel] = {}
+    # Channel metadata is static, so it is built once at registration
+    _metadata: dict[str, dict[str, Any]] = {}
+    # Config validators are compiled from each channel's schema at registration
+    _validators: dict[str, ConfigValidator] = {}
+    # Serialized channel listing, rebuilt only when a channel registers
+    _metadata_json: bytes | None = None
+
+    # Built-in channels are imported on first lookup of their type, so their client
+    # libraries (aiosmtplib, httpx) are only loaded by processes that use them
+    _BUILTIN_MODULES = {
+        "email": "app.domains.notifications.channels.email",
+        "webhook": "app.domains.notifications.channels.webhook",
+    }
+    _loaded = False
+
+    @classmethod
+    def _ensure_loaded(cls, channel_type: str | None = None) -> None:
+        """Import built-in channel modules so they register themselves"""
+        if cls._loaded or channel_type in cls._channels:
+            return
+        if channel_type is not None:
+            # Only the requested channel's module is needed
+            module_name = cls._BUILTIN_MODULES.get(channel_type)
+            if module_name:
+                importlib.import_module(module_name)
+            return
+        cls._loaded = True
+        for module_name in cls._BUILTIN_MODULES.values():
+            importlib.import_module(module_name)
 
     @classmethod
-    def register(cls, channel_class: Type[BaseNotificationChannel]) -> None:
+    def register(cls, channel_class: type[BaseNotificationChannel]) -> None:
         """Register a notification channel class"""
         instance = channel_class()
         channel_type = instance.channel_type
@@ -17,36 +93,68 @@ class ChannelRegistry:
             raise ValueError(f"Channel type '{channel_type}' is already registered")
 
         cls._channels[channel_type] = channel_class
-        print(f"✓ Registered notification channel: {channel_type}")
+        cls._instances[channel_type] = instance
+        config_schema = instance.get_config_schema()
+        cls._metadata[channel_type] = {
+            "type": channel_type,
+            "display_name": instance.display_name,
+            "config_schema": config_schema
+        }
+        cls._validators[channel_type] = _compile_validator(config_schema)
+        cls._metadata_json = None
+        logger.debug("Registered notification channel: %s", channel_type)
 
     @classmethod
     def is_registered(cls, channel_type: str) -> bool:
         """Check if a channel type is registered"""
+        cls._ensure_loaded(channel_type)
         return channel_type in cls._channels
 
     @classmethod
-    def get_channel(cls, channel_type: str) -> Type[BaseNotificationChannel]:
+    def get_channel(cls, channel_type: str) -> type[BaseNotificationChannel]:
         """Get a channel class by type"""
+        cls._ensure_loaded(channel_type)
         if channel_type not in cls._channels:
             available = ", ".join(cls._channels.keys())
             raise KeyError(f"Channel type '{channel_type}' not found. Available: {available}")
         return cls._channels[channel_type]
 
     @classmethod
-    def list_channels(cls) -> List[Dict[str, Any]]:
+    def get_instance(cls, channel_type: str) -> BaseNotificationChannel:
+        """Get the shared channel instance for a type"""
+        cls._ensure_loaded(channel_type)
+        if channel_type not in cls._instances:
+            available = ", ".join(cls._instances.keys())
+            raise KeyError(f"Channel type '{channel_type}' not found. Available: {available}")
+        return cls._instances[channel_type]
+
+    @classmethod
+    def validate_config(cls, channel_type: str, config: dict[str, Any]) -> list[str]:
+        """Validate a channel configuration, returning a list of error messages"""
+        cls._ensure_loaded(channel_type)
+        if channel_type not in cls._validators:
+            available = ", ".join(cls._validators.keys())
+            raise KeyError(f"Channel type '{channel_type}' not found. Available: {available}")
+        return cls._validators[channel_type](config)
+
+    @classmethod
+    def list_channels(cls) -> list[dict[str, Any]]:
         """List all registered channels with their schemas"""
-        result = []
-        for channel_type, channel_class in cls._channels.items():
-            instance = channel_class()
-            result.append({
-                "type": channel_type,
-                "display_name": instance.display_name,
-                "config_schema": instance.get_config_schema()
-            })
-        return result
-
-
-def register_channel(channel_class: Type[BaseNotificationChannel]) -> Type[BaseNotificationChannel]:
+        cls._ensure_loaded()
+        return list(cls._metadata.values())
+
+    @classmethod
+    def list_channels_json(cls) -> bytes:
+        """List all registered channels with their schemas, serialized as JSON"""
+        cls._ensure_loaded()
+        if cls._metadata_json is None:
+            cls._metadata_json = json.dumps(
+                list(cls._metadata.values()), separators=(",", ":")
+            ).encode()
+        return cls._metadata_json
+
+
+def register_channel(channel_class: type[BaseNotificationChannel]) -> type[BaseNotificationChannel]:
     """Decorator to register a notification channel"""
     ChannelRegistry.register(channel_class)
     return channel_class
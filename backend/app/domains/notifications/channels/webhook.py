@@ -1,11 +1,142 @@
 """Webhook notification channel using HTTP POST"""
+import hashlib
+import time
+
 import httpx
-from typing import Any, Dict
+from functools import cached_property
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, PrivateAttr, field_validator
 
+from ._http import get_client
 from .base import BaseNotificationChannel, NotificationPayload
 from .registry import register_channel
 
 
+class WebhookConfig(BaseModel):
+    """Validated webhook channel configuration, mirroring WebhookChannel's config schema"""
+    # Parsed configs are cached and shared between sends
+    model_config = ConfigDict(frozen=True)
+
+    url: HttpUrl = Field(..., title="Webhook URL", description="URL to send notifications to")
+    method: Literal["POST", "PUT"] = Field("POST", title="HTTP Method", description="HTTP method to use")
+    headers: dict[str, str] = Field(
+        {},
+        title="Custom Headers",
+        description="Additional HTTP headers to include"
+    )
+    auth_type: Literal["none", "bearer", "basic"] = Field(
+        "none", title="Authentication Type", description="Type of authentication to use"
+    )
+    auth_token: str = Field(
+        "", title="Bearer Token", description="Bearer token for authentication (if auth_type is 'bearer')"
+    )
+    auth_username: str = Field(
+        "", title="Basic Auth Username", description="Username for basic authentication (if auth_type is 'basic')"
+    )
+    auth_password: str = Field(
+        "",
+        title="Basic Auth Password",
+        description="Password for basic authentication (if auth_type is 'basic')"
+    )
+
+    @field_validator("method", mode="before")
+    @classmethod
+    def _upper_method(cls, value: Any) -> Any:
+        return value.upper() if isinstance(value, str) else value
+
+    # Request details derived once per parsed config and reused by every send
+
+    @cached_property
+    def target_url(self) -> str:
+        return str(self.url)
+
+    @cached_property
+    def request_headers(self) -> dict[str, str]:
+        """Custom headers plus bearer authentication"""
+        headers = dict(self.headers)
+        if self.auth_type == "bearer":
+            headers["Authorization"] = f"Bearer {self.auth_token}"
+        return headers
+
+    @cached_property
+    def send_headers(self) -> dict[str, str]:
+        """Headers for notification deliveries"""
+        headers = dict(self.request_headers)
+        headers.setdefault("Content-Type", "application/json")
+        return headers
+
+    @cached_property
+    def auth(self) -> Optional[httpx.BasicAuth]:
+        if self.auth_type == "basic":
+            return httpx.BasicAuth(username=self.auth_username, password=self.auth_password)
+        return None
+
+    @cached_property
+    def probe_key(self) -> tuple[str, str]:
+        """Connection test cache key: URL plus a digest of the credentials sent"""
+        credentials = "\0".join([
+            self.auth_type, self.auth_token, self.auth_username, self.auth_password,
+            *(f"{name}:{value}" for name, value in sorted(self.headers.items())),
+        ])
+        return self.target_url, hashlib.sha256(credentials.encode()).hexdigest()
+
+    # Delivery request built once against the shared client: (client, method, url, headers, extensions)
+    _template: Optional[tuple] = PrivateAttr(default=None)
+
+    def build_request(self, client: httpx.AsyncClient, content: bytes) -> httpx.Request:
+        """
+        Build a delivery request carrying the given body.
+
+        The URL is parsed and the client's default headers and timeouts merged
+        only once; each delivery copies that template with a fresh body.
+        """
+        template = self._template
+        if template is None or template[0] is not client:
+            request = client.build_request(self.method, self.target_url, headers=self.send_headers)
+            headers = request.headers.copy()
+            # Recomputed from each delivery's body
+            del headers["Content-Length"]
+            template = (client, request.method, request.url, headers, request.extensions)
+            self._template = template
+
+        _, method, url, headers, extensions = template
+        return httpx.Request(method, url, headers=headers, content=content, extensions=extensions)
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable snapshot of a JSON value"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Validated configurations keyed by a snapshot of the stored config, so a
+# channel that fires repeatedly is only validated once
+_PARSED_CONFIGS: dict[Any, "WebhookConfig"] = {}
+_MAX_PARSED_CONFIGS = 256
+
+
+def parse_config(config: dict[str, Any]) -> WebhookConfig:
+    """Get the validated configuration for a channel's stored config"""
+    key = _freeze(config)
+    parsed = _PARSED_CONFIGS.get(key)
+    if parsed is None:
+        parsed = WebhookConfig.model_validate(config)
+        if len(_PARSED_CONFIGS) >= _MAX_PARSED_CONFIGS:
+            _PARSED_CONFIGS.clear()
+        _PARSED_CONFIGS[key] = parsed
+    return parsed
+
+
+# Successful connection tests keyed by WebhookConfig.probe_key, so a settings
+# page that re-tests repeatedly doesn't probe the endpoint every time
+_probe_cache: dict[tuple[str, str], float] = {}
+PROBE_CACHE_TTL_SECONDS = 10
+
+
 @register_channel
 class WebhookChannel(BaseNotificationChannel):
     """Send notifications via HTTP webhook"""
@@ -18,121 +149,91 @@ class WebhookChannel(BaseNotificationChannel):
     def display_name(self) -> str:
         return "Webhook (HTTP)"
 
-    async def send(self, config: Dict[str, Any], payload: NotificationPayload) -> bool:
-        """Send webhook notification"""
-        url = config.get("url")
-        method = config.get("method", "POST").upper()
-        headers = dict(config.get("headers", {}))
+    # Hand-written to keep the shape the settings form renders from;
+    # WebhookConfig mirrors it for validation
+    _CONFIG_SCHEMA: dict[str, Any] = {
+        "type": "object",
+        "required": ["url"],
+        "properties": {
+            "url": {
+                "type": "string",
+                "format": "uri",
+                "title": "Webhook URL",
+                "description": "URL to send notifications to"
+            },
+            "method": {
+                "type": "string",
+                "enum": ["POST", "PUT"],
+                "default": "POST",
+                "title": "HTTP Method",
+                "description": "HTTP method to use"
+            },
+            "headers": {
+                "type": "object",
+                "additionalProperties": {"type": "string"},
+                "default": {},
+                "title": "Custom Headers",
+                "description": "Additional HTTP headers to include"
+            },
+            "auth_type": {
+                "type": "string",
+                "enum": ["none", "bearer", "basic"],
+                "default": "none",
+                "title": "Authentication Type",
+                "description": "Type of authentication to use"
+            },
+            "auth_token": {
+                "type": "string",
+                "title": "Bearer Token",
+                "description": "Bearer token for authentication (if auth_type is 'bearer')"
+            },
+            "auth_username": {
+                "type": "string",
+                "title": "Basic Auth Username",
+                "description": "Username for basic authentication (if auth_type is 'basic')"
+            },
+            "auth_password": {
+                "type": "string",
+                "title": "Basic Auth Password",
+                "format": "password",
+                "description": "Password for basic authentication (if auth_type is 'basic')"
+            }
+        }
+    }
 
-        # Set content type
-        headers.setdefault("Content-Type", "application/json")
+    async def send(self, config: dict[str, Any], payload: NotificationPayload) -> bool:
+        """Send webhook notification"""
+        webhook = parse_config(config)
 
-        # Add authentication if configured
-        auth_type = config.get("auth_type", "none")
-        auth = None
-
-        if auth_type == "bearer":
-            headers["Authorization"] = f"Bearer {config.get('auth_token', '')}"
-        elif auth_type == "basic":
-            auth = httpx.BasicAuth(
-                username=config.get("auth_username", ""),
-                password=config.get("auth_password", "")
-            )
-
-        # Prepare payload as dict
-        payload_dict = payload.model_dump(mode="json")
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                json=payload_dict,
-                headers=headers,
-                auth=auth
-            )
-            response.raise_for_status()
+        client = await get_client()
+        request = webhook.build_request(client, payload.json_body)
+        response = await client.send(request, auth=webhook.auth)
+        response.raise_for_status()
 
         return True
 
-    def get_config_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "required": ["url"],
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "format": "uri",
-                    "title": "Webhook URL",
-                    "description": "URL to send notifications to"
-                },
-                "method": {
-                    "type": "string",
-                    "enum": ["POST", "PUT"],
-                    "default": "POST",
-                    "title": "HTTP Method",
-                    "description": "HTTP method to use"
-                },
-                "headers": {
-                    "type": "object",
-                    "additionalProperties": {"type": "string"},
-                    "default": {},
-                    "title": "Custom Headers",
-                    "description": "Additional HTTP headers to include"
-                },
-                "auth_type": {
-                    "type": "string",
-                    "enum": ["none", "bearer", "basic"],
-                    "default": "none",
-                    "title": "Authentication Type",
-                    "description": "Type of authentication to use"
-                },
-                "auth_token": {
-                    "type": "string",
-                    "title": "Bearer Token",
-                    "description": "Bearer token for authentication (if auth_type is 'bearer')"
-                },
-                "auth_username": {
-                    "type": "string",
-                    "title": "Basic Auth Username",
-                    "description": "Username for basic authentication (if auth_type is 'basic')"
-                },
-                "auth_password": {
-                    "type": "string",
-                    "title": "Basic Auth Password",
-                    "format": "password",
-                    "description": "Password for basic authentication (if auth_type is 'basic')"
-                }
-            }
-        }
-
-    async def test_connection(self, config: Dict[str, Any]) -> bool:
-        """Test webhook connection with a HEAD or OPTIONS request"""
-        url = config.get("url")
-        headers = dict(config.get("headers", {}))
-
-        # Add authentication if configured
-        auth_type = config.get("auth_type", "none")
-        auth = None
-
-        if auth_type == "bearer":
-            headers["Authorization"] = f"Bearer {config.get('auth_token', '')}"
-        elif auth_type == "basic":
-            auth = httpx.BasicAuth(
-                username=config.get("auth_username", ""),
-                password=config.get("auth_password", "")
-            )
-
-        async with httpx.AsyncClient(timeout=10) as client:
-            # Try OPTIONS first (CORS preflight), fall back to HEAD
-            try:
-                response = await client.options(url, headers=headers, auth=auth)
-            except httpx.HTTPStatusError:
-                response = await client.head(url, headers=headers, auth=auth)
-
-            # Accept 2xx, 405 (method not allowed), or 404 (endpoint might only accept POST)
-            # These all indicate the server is reachable
-            if response.status_code < 500:
-                return True
+    def get_config_schema(self) -> dict[str, Any]:
+        return self._CONFIG_SCHEMA
+
+    async def test_connection(self, config: dict[str, Any]) -> bool:
+        """Test webhook connection with a HEAD request"""
+        webhook = parse_config(config)
+        key = webhook.probe_key
+        expires_at = _probe_cache.get(key)
+        if expires_at is not None and expires_at > time.monotonic():
+            return True
+
+        client = await get_client()
+        response = await client.head(
+            webhook.target_url, headers=webhook.request_headers, auth=webhook.auth, timeout=10
+        )
+
+        # Accept 2xx, 405 (method not allowed), or 404 (endpoint might only accept POST)
+        # These all indicate the server is reachable
+        if response.status_code >= 500:
             response.raise_for_status()
 
+        if len(_probe_cache) >= _MAX_PARSED_CONFIGS:
+            _probe_cache.clear()
+        _probe_cache[key] = time.monotonic() + PROBE_CACHE_TTL_SECONDS
         return True
@@ -0,0 +1,156 @@
+"""Background delivery of notifications, off the check worker"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import update
+
+from app.core.database import get_db_context
+from .channels.base import NotificationPayload
+from .channels.registry import ChannelRegistry
+from .models import NotificationLog, NotificationStatus
+
+logger = logging.getLogger(__name__)
+
+# How long shutdown waits for queued notifications before abandoning them
+DRAIN_TIMEOUT_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class Delivery:
+    """A notification to send, tied to its pending log row"""
+    log_id: int
+    sent_at: datetime
+    rule_name: str
+    channel_type: str
+    configuration: dict[str, Any]
+    payload: NotificationPayload
+
+
+class NotificationDispatcher:
+    """
+    In-memory queue of notifications delivered by background workers.
+
+    Check workers only record pending logs and enqueue, so a slow webhook or
+    SMTP server delays other notifications rather than the next check.
+    Like the event bus this is single-process: deliveries still queued when
+    the process dies stay PENDING in notification_logs.
+    """
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._batch_size = 1
+
+    @property
+    def is_running(self) -> bool:
+        """Whether background workers are consuming the queue"""
+        return self._queue is not None
+
+    def start(self, workers: int, batch_size: int) -> None:
+        """
+        Spawn the worker tasks.
+
+        Args:
+            workers: Number of concurrent worker tasks
+            batch_size: Max deliveries a worker sends and records together
+        """
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue()
+        self._batch_size = max(1, batch_size)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(workers)]
+        logger.info(f"Notification dispatcher started with {workers} workers")
+
+    async def stop(self) -> None:
+        """Drain the queue, then stop the workers"""
+        if not self.is_running:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=DRAIN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Notification dispatcher stopped with {self._queue.qsize()} deliveries still queued"
+            )
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._queue = None
+        self._workers = []
+
+    async def submit(self, deliveries: List[Delivery]) -> None:
+        """
+        Hand deliveries to the background workers.
+
+        When the dispatcher isn't running (scripts, tests) they are delivered inline.
+        """
+        if not self.is_running:
+            await self._deliver(deliveries)
+            return
+        for delivery in deliveries:
+            self._queue.put_nowait(delivery)
+
+    async def _worker(self) -> None:
+        """Pull batches of deliveries off the queue and send them"""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._deliver(batch)
+            except Exception as e:
+                logger.error(f"Error delivering notification batch: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    @staticmethod
+    async def _deliver(deliveries: List[Delivery]) -> None:
+        """Send deliveries concurrently and record every outcome in one commit"""
+        if not deliveries:
+            return
+
+        # Each delivery targets an independent endpoint, so send them all at once
+        errors = await asyncio.gather(*(NotificationDispatcher._send(d) for d in deliveries))
+
+        async with get_db_context() as db:
+            await db.execute(
+                update(NotificationLog),
+                [
+                    {
+                        "id": delivery.log_id,
+                        "sent_at": delivery.sent_at,
+                        "status": NotificationStatus.SENT if error is None else NotificationStatus.FAILED,
+                        "error_message": error,
+                    }
+                    for delivery, error in zip(deliveries, errors)
+                ]
+            )
+
+    @staticmethod
+    async def _send(delivery: Delivery) -> Optional[str]:
+        """
+        Send one notification via its channel.
+
+        Returns:
+            None on success, otherwise the error message
+        """
+        try:
+            channel_instance = ChannelRegistry.get_instance(delivery.channel_type)
+            await channel_instance.send(delivery.configuration, delivery.payload)
+
+            logger.info(
+                f"Notification sent via {delivery.channel_type} for rule '{delivery.rule_name}'"
+            )
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to send notification for rule '{delivery.rule_name}': {e}")
+            return str(e)
+
+
+# Global dispatcher instance (started in main.py)
+notification_dispatcher = NotificationDispatcher()
@@ -1,7 +1,8 @@
 """Notifications domain models"""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum as SQLEnum, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum as SQLEnum, Index, CheckConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 import enum
 from typing import TYPE_CHECKING
 
@@ -33,6 +34,28 @@ class NotificationStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+def _enum_column_type(enum_class: type[enum.Enum]) -> SQLEnum:
+    """
+    Store an enum as its lowercase value in a VARCHAR column.
+
+    Avoids native Postgres enum types, so adding a member needs no ALTER TYPE;
+    allowed values are enforced by a CHECK constraint on the table instead.
+    """
+    return SQLEnum(
+        enum_class,
+        native_enum=False,
+        create_constraint=False,
+        length=32,
+        values_callable=lambda members: [member.value for member in members],
+    )
+
+
+def _check_in(column: str, enum_class: type[enum.Enum]) -> str:
+    """SQL CHECK expression restricting a column to an enum's values"""
+    values = ", ".join(f"'{member.value}'" for member in enum_class)
+    return f"{column} IN ({values})"
+
+
 class NotificationChannel(Base):
     """Configuration for a notification channel (email, webhook, etc.)"""
 
@@ -43,12 +66,12 @@ class NotificationChannel(Base):
 
     # Channel identification
     name = Column(String(255), nullable=False)
-    channel_type = Column(SQLEnum(NotificationChannelType), nullable=False, index=True)
+    channel_type = Column(_enum_column_type(NotificationChannelType), nullable=False, index=True)
 
-    # Channel-specific configuration stored as JSON
+    # Channel-specific configuration stored as JSONB
     # email: {smtp_host, smtp_port, smtp_user, smtp_password, from_address, to_addresses[], use_tls}
     # webhook: {url, method, headers, auth_type, auth_token, auth_username, auth_password}
-    configuration = Column(JSON, nullable=False, default=dict)
+    configuration = Column(JSONB, nullable=False, default=dict)
 
     # Status
     is_enabled = Column(Boolean, default=True, nullable=False)
@@ -57,9 +80,20 @@ class NotificationChannel(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    # Serves keyset-paginated listings newest-first within an organization
+    __table_args__ = (
+        Index("ix_notification_channels_org_created_id", organization_id, created_at.desc(), id.desc()),
+        CheckConstraint(_check_in("channel_type", NotificationChannelType), name="ck_notification_channels_channel_type"),
+    )
+
     # Relationships
+    # Reverse collections never load implicitly; use selectinload() where they are needed.
+    # ON DELETE CASCADE removes children, so deletes don't need them loaded either.
     organization = relationship("Organization", backref="notification_channels")
-    notification_rules = relationship("NotificationRule", back_populates="channel", cascade="all, delete-orphan", lazy="select")
+    notification_rules = relationship(
+        "NotificationRule", back_populates="channel", cascade="all, delete-orphan",
+        lazy="raise_on_sql", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<NotificationChannel(id={self.id}, name='{self.name}', type='{self.channel_type}')>"
@@ -78,11 +112,11 @@ class NotificationRule(Base):
     name = Column(String(255), nullable=False)
 
     # Trigger type
-    trigger = Column(SQLEnum(NotificationTrigger), nullable=False, index=True)
+    trigger = Column(_enum_column_type(NotificationTrigger), nullable=False, index=True)
 
     # Filtering (null means all)
-    site_ids = Column(JSON, nullable=True)  # List of site IDs or null for all sites
-    check_types = Column(JSON, nullable=True)  # List of check types or null for all types
+    site_ids = Column(JSONB, nullable=True)  # List of site IDs or null for all sites
+    check_types = Column(JSONB, nullable=True)  # List of check types or null for all types
 
     # Conditions
     consecutive_failures = Column(Integer, default=1, nullable=False)  # Trigger after N consecutive failures
@@ -94,10 +128,26 @@ class NotificationRule(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    # Serves keyset-paginated listings newest-first within an organization
+    __table_args__ = (
+        Index("ix_notification_rules_org_created_id", organization_id, created_at.desc(), id.desc()),
+        CheckConstraint(_check_in("trigger", NotificationTrigger), name="ck_notification_rules_trigger"),
+        # Serves rule matching per check result, which only ever wants enabled rules
+        Index(
+            "ix_notification_rules_org_trigger_enabled",
+            organization_id,
+            trigger,
+            postgresql_where=text("is_enabled"),
+        ),
+    )
+
     # Relationships
     organization = relationship("Organization", backref="notification_rules")
     channel = relationship("NotificationChannel", back_populates="notification_rules")
-    logs = relationship("NotificationLog", back_populates="rule", cascade="all, delete-orphan", lazy="select")
+    logs = relationship(
+        "NotificationLog", back_populates="rule", cascade="all, delete-orphan",
+        lazy="raise_on_sql", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<NotificationRule(id={self.id}, name='{self.name}', trigger='{self.trigger}')>"
@@ -108,7 +158,8 @@ class NotificationLog(Base):
 
     __tablename__ = "notification_logs"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # Partitioned by month on sent_at, which therefore has to be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     rule_id = Column(Integer, ForeignKey("notification_rules.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Related entities (optional, for reference)
@@ -116,11 +167,18 @@ class NotificationLog(Base):
     incident_id = Column(Integer, ForeignKey("incidents.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # Delivery status
-    status = Column(SQLEnum(NotificationStatus), default=NotificationStatus.PENDING, nullable=False, index=True)
+    status = Column(_enum_column_type(NotificationStatus), default=NotificationStatus.PENDING, nullable=False, index=True)
     error_message = Column(Text, nullable=True)
 
     # Timestamp
-    sent_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    sent_at = Column(DateTime(timezone=True), server_default=func.now(), primary_key=True, index=True)
+
+    # Serves per-rule log listings newest-first without a separate sort
+    __table_args__ = (
+        Index("ix_notification_logs_rule_id_sent_at", rule_id, sent_at.desc()),
+        CheckConstraint(_check_in("status", NotificationStatus), name="ck_notification_logs_status"),
+        {"postgresql_partition_by": "RANGE (sent_at)"},
+    )
 
     # Relationships
     rule = relationship("NotificationRule", back_populates="logs")
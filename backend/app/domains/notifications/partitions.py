@@ -0,0 +1,59 @@
+"""Monthly partition maintenance for notification_logs"""
+import logging
+from datetime import date, datetime, timezone
+from typing import List, Tuple
+
+from sqlalchemy import text
+
+from app.core.database import get_db_context
+
+logger = logging.getLogger(__name__)
+
+# Partitions are kept this many months ahead of the current one
+PARTITION_MONTHS_AHEAD = 2
+
+
+def month_ranges(today: date, months_ahead: int) -> List[Tuple[date, date]]:
+    """
+    Get [start, end) bounds for the current month and the months after it.
+
+    Args:
+        today: Any day in the current month
+        months_ahead: How many following months to include
+
+    Returns:
+        List of (first day of month, first day of next month) tuples
+    """
+    ranges = []
+    start = today.replace(day=1)
+    for _ in range(months_ahead + 1):
+        end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+async def ensure_log_partitions(months_ahead: int = PARTITION_MONTHS_AHEAD) -> None:
+    """
+    Create any missing monthly notification_logs partitions.
+
+    Runs at startup and daily from the scheduler, so inserts always land in a
+    monthly partition rather than the default one.
+    """
+    today = datetime.now(timezone.utc).date()
+    statements = [
+        "CREATE TABLE IF NOT EXISTS notification_logs_default PARTITION OF notification_logs DEFAULT"
+    ]
+    for start, end in month_ranges(today, months_ahead):
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS notification_logs_p{start:%Y%m} PARTITION OF notification_logs "
+            f"FOR VALUES FROM ('{start} 00:00:00+00') TO ('{end} 00:00:00+00')"
+        )
+
+    # Each partition in its own transaction, so one failure doesn't block the rest
+    for statement in statements:
+        try:
+            async with get_db_context() as db:
+                await db.execute(text(statement))
+        except Exception as e:
+            logger.error(f"Failed to create notification log partition: {e}")
@@ -1,11 +1,13 @@
 """Notification service for handling check results and sending notifications"""
 import logging
-from typing import Optional, List
-from datetime import datetime
+import time
+from typing import Dict, Optional, List, Tuple
+from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import cast, exists, insert, literal, or_, select
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, raiseload
 
 from .models import (
     NotificationChannel,
@@ -16,11 +18,31 @@ from .models import (
 )
 from .channels.registry import ChannelRegistry
 from .channels.base import NotificationPayload
+from .dispatcher import Delivery, notification_dispatcher
+from app.core.config import settings
 from app.domains.checks.models import CheckConfiguration, CheckResult, CheckStatus
 from app.domains.sites.models import Site
 
 logger = logging.getLogger(__name__)
 
+# How long the "does this org have any enabled rule for this trigger" answer is trusted
+RULE_PRESENCE_TTL_SECONDS = 30
+
+# (organization_id, trigger) -> (expires_at monotonic, has_rules)
+_rule_presence_cache: Dict[Tuple[int, NotificationTrigger], Tuple[float, bool]] = {}
+
+
+def _list_filter_matches(column, value):
+    """
+    SQL predicate for a JSON list filter column: true when the filter is unset
+    (SQL NULL, JSON null or an empty list) or contains the value.
+    """
+    return or_(
+        column.is_(None),
+        column.in_([cast(literal("null"), JSONB), cast(literal("[]"), JSONB)]),
+        column.contains([value]),
+    )
+
 
 class NotificationService:
     """Service for processing check results and sending notifications"""
@@ -47,26 +69,43 @@ class NotificationService:
         if check_result.status == CheckStatus.FAILURE:
             trigger = NotificationTrigger.CHECK_FAILURE
         elif check_result.status == CheckStatus.SUCCESS:
-            # Check if this is a recovery (previous was failure)
-            is_recovery = await NotificationService._is_recovery(
-                db, check_config.id, check_result.id
-            )
-            if is_recovery:
-                trigger = NotificationTrigger.CHECK_RECOVERY
+            trigger = NotificationTrigger.CHECK_RECOVERY
 
         if not trigger:
             return  # No notification needed
 
+        # Skip every further query for organizations without rules for this trigger
+        if not await NotificationService._has_rules(db, site.organization_id, trigger):
+            return
+
+        if trigger == NotificationTrigger.CHECK_RECOVERY:
+            # Only a success following a failure is a recovery
+            statuses = await NotificationService._recent_statuses(
+                db, check_config.id, check_result.id, limit=2
+            )
+            if len(statuses) < 2 or statuses[1] != CheckStatus.FAILURE:
+                return
+
         # Find matching rules
         rules = await NotificationService._find_matching_rules(
             db,
             site.organization_id,
             trigger,
             site.id,
-            check_config.check_type,
-            check_config.id
+            check_config.check_type
         )
 
+        # Check consecutive failures requirement (only for failure trigger).
+        # History is fetched once, just deep enough for the strictest rule.
+        if rules and trigger == NotificationTrigger.CHECK_FAILURE:
+            needed = max(rule.consecutive_failures for rule in rules)
+            if needed > 1:
+                statuses = await NotificationService._recent_statuses(
+                    db, check_config.id, check_result.id, limit=needed
+                )
+                consecutive = NotificationService._count_leading_failures(statuses)
+                rules = [rule for rule in rules if rule.consecutive_failures <= consecutive]
+
         if not rules:
             return  # No matching rules
 
@@ -80,39 +119,91 @@ class NotificationService:
             status=check_result.status.value if isinstance(check_result.status, CheckStatus) else check_result.status,
             error_message=check_result.error_message,
             response_time_ms=int(check_result.response_time_ms) if check_result.response_time_ms else None,
-            checked_at=check_result.checked_at or datetime.utcnow(),
+            checked_at=check_result.checked_at or datetime.now(timezone.utc),
         )
 
-        # Send notifications for each matching rule
-        for rule in rules:
-            await NotificationService._send_notification(
-                db, rule, payload, check_result.id
+        # Record a pending log per rule, then hand the sends to the dispatcher
+        # so slow channels never hold up the check worker. All rows go in one
+        # multi-row INSERT ... RETURNING the primary key; sent_at comes from the
+        # server default.
+        result = await db.execute(
+            insert(NotificationLog).returning(
+                NotificationLog.id, NotificationLog.sent_at, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    "rule_id": rule.id,
+                    "check_result_id": check_result.id,
+                    "status": NotificationStatus.PENDING,
+                }
+                for rule in rules
+            ]
+        )
+        log_keys = result.all()
+
+        deliveries = [
+            Delivery(
+                log_id=log_id,
+                sent_at=sent_at,
+                rule_name=rule.name,
+                channel_type=rule.channel.channel_type.value,
+                configuration=rule.channel.configuration,
+                payload=payload,
             )
+            for rule, (log_id, sent_at) in zip(rules, log_keys)
+        ]
+        await db.commit()
+
+        await notification_dispatcher.submit(deliveries)
 
     @staticmethod
-    async def _is_recovery(
+    async def _has_rules(
         db: AsyncSession,
-        check_config_id: int,
-        current_result_id: int
+        organization_id: int,
+        trigger: NotificationTrigger
     ) -> bool:
-        """Check if current success is a recovery from previous failure"""
-        # Get the previous result (before the current one)
+        """Check whether an organization has any enabled rule for a trigger"""
+        key = (organization_id, trigger)
+        cached = _rule_presence_cache.get(key)
+        now = time.monotonic()
+        if cached and cached[0] > now:
+            return cached[1]
+
+        has_rules = bool(await db.scalar(
+            select(exists().where(
+                NotificationRule.organization_id == organization_id,
+                NotificationRule.trigger == trigger,
+                NotificationRule.is_enabled.is_(True),
+            ))
+        ))
+        _rule_presence_cache[key] = (now + RULE_PRESENCE_TTL_SECONDS, has_rules)
+        return has_rules
+
+    @staticmethod
+    def invalidate_rule_cache(organization_id: int) -> None:
+        """Forget cached rule presence for an organization after its rules change"""
+        for key in [key for key in _rule_presence_cache if key[0] == organization_id]:
+            _rule_presence_cache.pop(key, None)
+
+    @staticmethod
+    async def _recent_statuses(
+        db: AsyncSession,
+        check_config_id: int,
+        current_result_id: int,
+        limit: int
+    ) -> List[CheckStatus]:
+        """Get statuses of the latest results up to and including the current one, newest first"""
         query = (
-            select(CheckResult)
+            select(CheckResult.status)
             .where(
                 CheckResult.check_configuration_id == check_config_id,
-                CheckResult.id < current_result_id
+                CheckResult.id <= current_result_id
             )
             .order_by(CheckResult.id.desc())
-            .limit(1)
+            .limit(limit)
         )
         result = await db.execute(query)
-        previous_result = result.scalar_one_or_none()
-
-        if previous_result and previous_result.status == CheckStatus.FAILURE:
-            return True
-
-        return False
+        return list(result.scalars().all())
 
     @staticmethod
     async def _find_matching_rules(
@@ -120,31 +211,47 @@ class NotificationService:
         organization_id: int,
         trigger: NotificationTrigger,
         site_id: int,
-        check_type: str,
-        check_config_id: int
+        check_type: str
     ) -> List[NotificationRule]:
         """Find enabled rules matching the criteria"""
-        # Get all enabled rules for this org and trigger
+        # Get enabled rules for this org and trigger whose channel is enabled too
         query = (
             select(NotificationRule)
-            .options(selectinload(NotificationRule.channel))
+            .join(NotificationChannel, NotificationRule.channel_id == NotificationChannel.id)
+            .options(contains_eager(NotificationRule.channel))
             .where(
                 NotificationRule.organization_id == organization_id,
                 NotificationRule.trigger == trigger,
-                NotificationRule.is_enabled == True,
+                NotificationRule.is_enabled.is_(True),
+                NotificationChannel.is_enabled.is_(True),
             )
         )
 
+        # Outside production, any relationship not loaded here raises on access
+        # instead of silently issuing a query per rule
+        if settings.ENVIRONMENT != "production":
+            query = query.options(
+                raiseload("*"),
+                contains_eager(NotificationRule.channel).raiseload("*"),
+            )
+
+        # On Postgres the site and check type filters are applied with jsonb containment
+        filter_in_sql = db.get_bind().dialect.name == "postgresql"
+        if filter_in_sql:
+            query = query.where(
+                _list_filter_matches(NotificationRule.site_ids, site_id),
+                _list_filter_matches(NotificationRule.check_types, check_type),
+            )
+
         result = await db.execute(query)
         rules = result.scalars().all()
 
+        if filter_in_sql:
+            return list(rules)
+
         # Filter rules
         matching = []
         for rule in rules:
-            # Skip if channel is disabled
-            if not rule.channel or not rule.channel.is_enabled:
-                continue
-
             # Check site filter
             if rule.site_ids and site_id not in rule.site_ids:
                 continue
@@ -153,81 +260,20 @@ class NotificationService:
             if rule.check_types and check_type not in rule.check_types:
                 continue
 
-            # Check consecutive failures requirement (only for failure trigger)
-            if trigger == NotificationTrigger.CHECK_FAILURE and rule.consecutive_failures > 1:
-                consecutive = await NotificationService._count_consecutive_failures(
-                    db, check_config_id
-                )
-                if consecutive < rule.consecutive_failures:
-                    continue
-
             matching.append(rule)
 
         return matching
 
     @staticmethod
-    async def _count_consecutive_failures(
-        db: AsyncSession,
-        check_config_id: int
-    ) -> int:
-        """Count consecutive failures for a check configuration"""
-        query = (
-            select(CheckResult)
-            .where(CheckResult.check_configuration_id == check_config_id)
-            .order_by(CheckResult.checked_at.desc())
-            .limit(100)  # Reasonable limit
-        )
-
-        result = await db.execute(query)
-        results = result.scalars().all()
-
+    def _count_leading_failures(statuses: List[CheckStatus]) -> int:
+        """Count consecutive failures at the start of a newest-first status list"""
         count = 0
-        for r in results:
-            if r.status == CheckStatus.FAILURE:
-                count += 1
-            else:
+        for status in statuses:
+            if status != CheckStatus.FAILURE:
                 break
-
+            count += 1
         return count
 
-    @staticmethod
-    async def _send_notification(
-        db: AsyncSession,
-        rule: NotificationRule,
-        payload: NotificationPayload,
-        check_result_id: int
-    ) -> None:
-        """Send notification via the rule's channel"""
-        # Create log entry
-        log = NotificationLog(
-            rule_id=rule.id,
-            check_result_id=check_result_id,
-            status=NotificationStatus.PENDING,
-            sent_at=datetime.utcnow()
-        )
-        db.add(log)
-        await db.flush()
-
-        try:
-            # Get channel implementation
-            channel_class = ChannelRegistry.get_channel(rule.channel.channel_type.value)
-            channel_instance = channel_class()
-
-            # Send notification
-            await channel_instance.send(rule.channel.configuration, payload)
-
-            log.status = NotificationStatus.SENT
-            logger.info(
-                f"Notification sent via {rule.channel.channel_type} for rule '{rule.name}'"
-            )
-
-        except Exception as e:
-            log.status = NotificationStatus.FAILED
-            log.error_message = str(e)
-            logger.error(f"Failed to send notification for rule '{rule.name}': {e}")
-
-        await db.commit()
-
     @staticmethod
     async def send_test_notification(
         db: AsyncSession,
@@ -235,8 +281,7 @@ class NotificationService:
     ) -> bool:
         """Send a test notification through a channel"""
         # Get channel implementation
-        channel_class = ChannelRegistry.get_channel(channel.channel_type.value)
-        channel_instance = channel_class()
+        channel_instance = ChannelRegistry.get_instance(channel.channel_type.value)
 
         # Test connection
         return await channel_instance.test_connection(channel.configuration)
@@ -29,8 +29,13 @@ class Site(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
-    organization = relationship("Organization", back_populates="sites", lazy="select")
-    check_configurations = relationship("CheckConfiguration", back_populates="site", cascade="all, delete-orphan", lazy="select")
+    # Never loaded implicitly; use selectinload() where they are needed.
+    # ON DELETE CASCADE removes check configurations, so deletes don't need them loaded.
+    organization = relationship("Organization", back_populates="sites", lazy="raise_on_sql")
+    check_configurations = relationship(
+        "CheckConfiguration", back_populates="site", cascade="all, delete-orphan",
+        lazy="raise_on_sql", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<Site(id={self.id}, name='{self.name}', url='{self.url}')>"
@@ -28,6 +28,10 @@ async def lifespan(app: FastAPI):
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
+    # Start background notification delivery before checks can produce results
+    from app.domains.notifications.dispatcher import notification_dispatcher
+    notification_dispatcher.start(settings.NOTIFICATION_WORKERS, settings.NOTIFICATION_BATCH_SIZE)
+
     # Initialize and start APScheduler
     from app.core.scheduler import init_scheduler
     from app.tasks.checks import sync_check_schedules
@@ -40,6 +44,18 @@ async def lifespan(app: FastAPI):
     # Sync existing check schedules
     await sync_check_schedules()
 
+    # Keep monthly notification log partitions ahead of inserts
+    from app.domains.notifications.partitions import ensure_log_partitions
+    await ensure_log_partitions()
+    scheduler.add_job(
+        ensure_log_partitions,
+        'cron',
+        hour=0,
+        minute=5,
+        id='notification_log_partitions',
+        replace_existing=True,
+    )
+
     print("✅ Application started successfully")
 
     yield
@@ -52,6 +68,22 @@ async def lifespan(app: FastAPI):
         scheduler.shutdown(wait=True)
         print("✅ APScheduler shutdown")
 
+    # Deliver notifications still queued, while channel clients are open
+    await notification_dispatcher.stop()
+    print("✅ Notification dispatcher stopped")
+
+    # Close pooled HTTP connections used by check plugins
+    from app.domains.checks.plugins._http import close_client
+    await close_client()
+
+    # Close pooled HTTP connections used by notification channels
+    from app.domains.notifications.channels._http import close_client as close_channel_client
+    await close_channel_client()
+
+    # Close pooled SMTP sessions used by the email channel
+    from app.domains.notifications.channels.email import close_smtp_connections
+    await close_smtp_connections()
+
     await engine.dispose()
     print("✅ Application shutdown complete")
 
@@ -74,6 +106,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets the frontend read list pagination cursors
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -49,8 +49,7 @@ async def execute_check(check_id: int):
 
         try:
             # Get check plugin and execute
-            check_class = CheckRegistry.get_check(check_config.check_type)
-            check_instance = check_class()
+            check_instance = CheckRegistry.get_instance(check_config.check_type)
 
             logger.debug(f"Executing {check_config.check_type} check for {site.url}")
             result = await check_instance.execute(
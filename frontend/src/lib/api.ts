@@ -141,12 +141,23 @@ export const checksApi = {
   },
 }
 
+// Fetch every page of a keyset-paginated list endpoint, following X-Next-Cursor
+const fetchAllPages = async <T>(path: string): Promise<T[]> => {
+  const items: T[] = []
+  let cursor: string | undefined
+  do {
+    const response = await api.get(cursor ? `${path}?${cursor}` : path)
+    items.push(...response.data)
+    cursor = response.headers['x-next-cursor']
+  } while (cursor)
+  return items
+}
+
 // Notifications API
 export const notificationsApi = {
   // Channels
   listChannels: async (): Promise<NotificationChannel[]> => {
-    const response = await api.get('/notifications/channels/')
-    return response.data
+    return fetchAllPages<NotificationChannel>('/notifications/channels/')
   },
 
   getChannel: async (id: number): Promise<NotificationChannel> => {
@@ -192,8 +203,7 @@ export const notificationsApi = {
 
   // Rules
   listRules: async (): Promise<NotificationRule[]> => {
-    const response = await api.get('/notifications/rules/')
-    return response.data
+    return fetchAllPages<NotificationRule>('/notifications/rules/')
   },
 
   getRule: async (id: number): Promise<NotificationRule> => {
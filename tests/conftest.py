@@ -17,6 +17,11 @@ def mock_httpx_response():
         response.text = content.decode() if isinstance(content, bytes) else content
         response.headers = headers or {"content-type": "text/html"}
         response.raise_for_status = MagicMock()
+
+        async def aiter_bytes(*args, **kwargs):
+            yield content
+
+        response.aiter_bytes = aiter_bytes
         return response
     return _create_response
 
@@ -0,0 +1,25 @@
+"""Tests for shared check plugin helpers"""
+import pytest
+
+from app.domains.checks.plugins.base import extract_host
+
+
+class TestExtractHost:
+    """Tests for extract_host"""
+
+    @pytest.mark.parametrize("url,expected", [
+        ("https://example.com", "example.com"),
+        ("https://example.com/path?q=1", "example.com"),
+        ("http://example.com:8080/health", "example.com"),
+        ("HTTPS://Example.com", "Example.com"),
+        ("example.com", "example.com"),
+        ("example.com:443", "example.com"),
+        ("192.168.1.10", "192.168.1.10"),
+    ])
+    def test_extracts_hostname(self, url, expected):
+        """Test hostname extraction from common URL shapes"""
+        assert extract_host(url) == expected
+
+    def test_empty_string(self):
+        """Test that an unparseable value is returned unchanged"""
+        assert extract_host("") == ""
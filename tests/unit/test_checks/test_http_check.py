@@ -3,7 +3,15 @@ import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
 
-from app.domains.checks.plugins.http_check import HTTPCheck
+from app.domains.checks.plugins.http_check import HTTPCheck, MAX_DRAIN_BYTES
+
+
+def stream_returning(response=None, side_effect=None):
+    """Build a mock for client.stream() yielding a response or raising on enter"""
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response, side_effect=side_effect)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=context)
 
 
 @pytest.fixture
@@ -11,6 +19,17 @@ def http_check():
     return HTTPCheck()
 
 
+@pytest.fixture
+def mock_client():
+    """Patch the shared HTTP client used by HTTPCheck"""
+    client = MagicMock()
+    with patch(
+        "app.domains.checks.plugins._http.get_client",
+        AsyncMock(return_value=client)
+    ):
+        yield client
+
+
 class TestHTTPCheck:
     """Tests for HTTPCheck plugin"""
 
@@ -35,71 +54,93 @@ class TestHTTPCheck:
         assert "follow_redirects" in schema["properties"]
 
     @pytest.mark.asyncio
-    async def test_execute_success(self, http_check, mock_httpx_response):
+    async def test_execute_success(self, http_check, mock_client, mock_httpx_response):
         """Test successful HTTP check"""
         mock_response = mock_httpx_response(status_code=200, content=b"OK")
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_client.stream = stream_returning(mock_response)
 
-            result = await http_check.execute(
-                "https://example.com",
-                {"expected_status_code": 200, "timeout_seconds": 10}
-            )
+        result = await http_check.execute(
+            "https://example.com",
+            {"expected_status_code": 200, "timeout_seconds": 10}
+        )
 
-            assert result.status == "success"
-            assert result.response_time_ms is not None
-            assert result.result_data["status_code"] == 200
+        assert result.status == "success"
+        assert result.response_time_ms is not None
+        assert result.result_data["status_code"] == 200
 
     @pytest.mark.asyncio
-    async def test_execute_wrong_status(self, http_check, mock_httpx_response):
+    async def test_execute_wrong_status(self, http_check, mock_client, mock_httpx_response):
         """Test HTTP check with unexpected status code"""
         mock_response = mock_httpx_response(status_code=404, content=b"Not Found")
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_client.stream = stream_returning(mock_response)
 
-            result = await http_check.execute(
-                "https://example.com",
-                {"expected_status_code": 200}
-            )
+        result = await http_check.execute(
+            "https://example.com",
+            {"expected_status_code": 200}
+        )
 
-            assert result.status == "failure"
-            assert "Expected status 200" in result.error_message
-            assert result.result_data["status_code"] == 404
+        assert result.status == "failure"
+        assert "Expected status 200" in result.error_message
+        assert result.result_data["status_code"] == 404
 
     @pytest.mark.asyncio
-    async def test_execute_timeout(self, http_check):
+    async def test_execute_timeout(self, http_check, mock_client):
         """Test HTTP check timeout"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=httpx.TimeoutException("Timeout")
-            )
+        mock_client.stream = stream_returning(side_effect=httpx.TimeoutException("Timeout"))
 
-            result = await http_check.execute(
-                "https://example.com",
-                {"timeout_seconds": 5}
-            )
+        result = await http_check.execute(
+            "https://example.com",
+            {"timeout_seconds": 5}
+        )
 
-            assert result.status == "failure"
-            assert "timed out" in result.error_message.lower()
+        assert result.status == "failure"
+        assert "timed out" in result.error_message.lower()
 
     @pytest.mark.asyncio
-    async def test_execute_connection_error(self, http_check):
+    async def test_execute_connection_error(self, http_check, mock_client):
         """Test HTTP check connection error"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=httpx.ConnectError("Connection refused")
-            )
-
-            result = await http_check.execute(
-                "https://example.com",
-                {}
-            )
-
-            assert result.status == "failure"
-            assert result.error_message is not None
+        mock_client.stream = stream_returning(side_effect=httpx.ConnectError("Connection refused"))
+
+        result = await http_check.execute(
+            "https://example.com",
+            {}
+        )
+
+        assert result.status == "failure"
+        assert result.error_message is not None
+
+    @pytest.mark.asyncio
+    async def test_execute_passes_follow_redirects(self, http_check, mock_client, mock_httpx_response):
+        """Test that redirect handling is set per request on the shared client"""
+        mock_client.stream = stream_returning(mock_httpx_response())
+
+        await http_check.execute("https://example.com", {"follow_redirects": False})
+
+        assert mock_client.stream.call_args.kwargs["follow_redirects"] is False
+
+    @pytest.mark.asyncio
+    async def test_execute_drains_body(self, http_check, mock_client, mock_httpx_response):
+        """Test that the body is read through and its size reported"""
+        mock_response = mock_httpx_response(content=b"x" * 1234, headers={})
+        mock_client.stream = stream_returning(mock_response)
+
+        result = await http_check.execute("https://example.com", {})
+
+        assert result.result_data["content_length"] == 1234
+        assert result.result_data["ttfb_ms"] <= result.result_data["response_time_ms"]
+
+    @pytest.mark.asyncio
+    async def test_execute_oversized_body_uses_header(self, http_check, mock_client, mock_httpx_response):
+        """Test that a body over the drain cap is abandoned and the header length used"""
+        mock_response = mock_httpx_response(
+            content=b"x" * (MAX_DRAIN_BYTES + 1),
+            headers={"content-length": str(MAX_DRAIN_BYTES + 1)}
+        )
+        mock_client.stream = stream_returning(mock_response)
+
+        result = await http_check.execute("https://example.com", {})
+
+        assert result.status == "success"
+        assert result.result_data["content_length"] == MAX_DRAIN_BYTES + 1
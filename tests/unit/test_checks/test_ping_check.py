@@ -0,0 +1,116 @@
+"""Tests for Ping check plugin"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch, MagicMock
+
+from app.domains.checks.plugins import ping_check
+from app.domains.checks.plugins.ping_check import PingCheck, PingBatcher
+
+
+FPING_OUTPUT = (
+    "example.com : 10.10 12.20 14.30\n"
+    "flaky.com   : 20.00 - 40.00\n"
+    "down.com    : - - -\n"
+)
+
+
+def make_fping_process(stderr: str):
+    process = MagicMock()
+    process.communicate = AsyncMock(return_value=(b"", stderr.encode()))
+    return process
+
+
+class TestPingBatcher:
+    """Tests for PingBatcher fping coalescing"""
+
+    def test_parse_fping_output(self):
+        """Test parsing of fping -C summary lines"""
+        stats = PingBatcher._parse_fping_output(FPING_OUTPUT, 3)
+
+        assert stats["example.com"]["packets_received"] == 3
+        assert stats["example.com"]["packet_loss"] == 0.0
+        assert stats["example.com"]["min_latency"] == 10.1
+        assert stats["example.com"]["avg_latency"] == 12.2
+        assert stats["example.com"]["max_latency"] == 14.3
+
+        assert stats["flaky.com"]["packets_received"] == 2
+        assert stats["flaky.com"]["packet_loss"] == 33.33
+
+        assert stats["down.com"]["packets_received"] == 0
+        assert stats["down.com"]["avg_latency"] is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_process(self):
+        """Test that concurrent requests are flushed into a single fping call"""
+        batcher = PingBatcher(delay_seconds=0.01)
+        process = make_fping_process(FPING_OUTPUT)
+
+        with patch.object(ping_check, "_FPING_BIN", "/usr/bin/fping"), \
+             patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            results = await asyncio.gather(
+                batcher.request("example.com", 3, 5),
+                batcher.request("down.com", 3, 5),
+                batcher.request("example.com", 3, 5),
+            )
+
+        assert mock_exec.call_count == 1
+        args = mock_exec.call_args.args
+        assert args[-2:] == ("example.com", "down.com")
+        assert results[0][0]["packets_received"] == 3
+        assert results[1][0]["packets_received"] == 0
+        assert results[2] == results[0]
+
+    @pytest.mark.asyncio
+    async def test_run_time_excludes_batching_delay(self):
+        """Test that the reported run time starts when the batch is flushed"""
+        batcher = PingBatcher(delay_seconds=0.2)
+        process = make_fping_process(FPING_OUTPUT)
+
+        with patch.object(ping_check, "_FPING_BIN", "/usr/bin/fping"), \
+             patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)):
+            _, run_ms = await batcher.request("example.com", 3, 5)
+
+        assert run_ms < 200
+
+    @pytest.mark.asyncio
+    async def test_missing_host_reported_unreachable(self):
+        """Test that hosts absent from fping output count as unreachable"""
+        batcher = PingBatcher(delay_seconds=0.01)
+        process = make_fping_process("unknown.invalid: Name or service not known\n")
+
+        with patch.object(ping_check, "_FPING_BIN", "/usr/bin/fping"), \
+             patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)):
+            stats, _ = await batcher.request("unknown.invalid", 3, 5)
+
+        assert stats["packets_received"] == 0
+        assert stats["packet_loss"] == 100.0
+
+
+class TestPingCheck:
+    """Tests for PingCheck plugin"""
+
+    @pytest.mark.asyncio
+    async def test_execute_uses_batcher_when_fping_available(self):
+        """Test that execute goes through the fping batcher"""
+        stats = PingBatcher._parse_fping_output(FPING_OUTPUT, 3)["example.com"]
+
+        with patch.object(ping_check, "_FPING_BIN", "/usr/bin/fping"), \
+             patch.object(ping_check._ping_batcher, "request", AsyncMock(return_value=(stats, 42))):
+            result = await PingCheck().execute("https://example.com", {"count": 3})
+
+        assert result.status == "success"
+        assert result.response_time_ms == 42
+        assert result.result_data["hostname"] == "example.com"
+        assert result.result_data["avg_latency"] == 12.2
+
+    @pytest.mark.asyncio
+    async def test_execute_unreachable_via_batcher(self):
+        """Test that a host with no replies is reported as unreachable"""
+        stats = PingBatcher._empty_stats(3)
+
+        with patch.object(ping_check, "_FPING_BIN", "/usr/bin/fping"), \
+             patch.object(ping_check._ping_batcher, "request", AsyncMock(return_value=(stats, 42))):
+            result = await PingCheck().execute("https://down.com", {"count": 3})
+
+        assert result.status == "failure"
+        assert "unreachable" in result.error_message
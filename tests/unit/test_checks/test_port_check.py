@@ -0,0 +1,41 @@
+"""Tests for TCP port check plugin"""
+import pytest
+from unittest.mock import patch
+
+from app.domains.checks.plugins.port_check import PortCheck
+
+
+@pytest.fixture
+def port_check():
+    return PortCheck()
+
+
+class TestPortCheck:
+    """Tests for PortCheck plugin"""
+
+    def test_check_type(self, port_check):
+        """Test check type identifier"""
+        assert port_check.check_type == "port"
+
+    def test_config_schema(self, port_check):
+        """Test configuration schema"""
+        schema = port_check.get_config_schema()
+        assert "ports" in schema["properties"]
+        assert schema["properties"]["ports"]["default"] == [80, 443]
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_closed_ports(self, port_check):
+        """Test that refused connections are reported as closed ports"""
+        def fake_check_port(hostname, port, timeout):
+            if port == 22:
+                raise ConnectionRefusedError()
+            return True
+
+        with patch.object(port_check, "_check_port", side_effect=fake_check_port):
+            result = await port_check.execute("https://example.com", {"ports": [22, 443]})
+
+        assert result.status == "failure"
+        assert result.result_data["hostname"] == "example.com"
+        assert result.result_data["open_ports"] == [443]
+        assert result.result_data["closed_ports"] == [22]
+        assert "22" in result.error_message
@@ -42,6 +42,17 @@ class TestCheckRegistry:
             CheckRegistry.get_check("unknown_check_type")
         assert "not found" in str(exc_info.value).lower()
 
+    def test_get_instance_returns_shared_instance(self):
+        """Test that get_instance returns the same instance on every call"""
+        instance = CheckRegistry.get_instance("http")
+        assert isinstance(instance, CheckRegistry.get_check("http"))
+        assert CheckRegistry.get_instance("http") is instance
+
+    def test_get_instance_unknown_type(self):
+        """Test that get_instance raises error for unknown type"""
+        with pytest.raises(KeyError):
+            CheckRegistry.get_instance("unknown_check_type")
+
     def test_is_registered_false_for_unknown(self):
         """Test that is_registered returns False for unknown type"""
         assert not CheckRegistry.is_registered("unknown_check_type")
@@ -65,6 +76,19 @@ class TestCheckRegistry:
             assert "description" in check
             assert "config_schema" in check
 
+    def test_list_checks_matches_check_metadata(self):
+        """Test that cached list_checks entries reflect the check class"""
+        checks = {c["type"]: c for c in CheckRegistry.list_checks()}
+        http_check = CheckRegistry.get_check("http")()
+
+        assert checks["http"]["display_name"] == http_check.display_name
+        assert checks["http"]["config_schema"] == http_check.get_config_schema()
+
+    def test_config_schema_is_built_once(self):
+        """Test that get_config_schema returns the class-level schema"""
+        check_class = CheckRegistry.get_check("http")
+        assert check_class().get_config_schema() is check_class().get_config_schema()
+
     def test_check_instance_has_required_methods(self):
         """Test that check instances have all required methods"""
         check_class = CheckRegistry.get_check("http")
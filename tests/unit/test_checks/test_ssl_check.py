@@ -1,12 +1,33 @@
 """Tests for SSL certificate check plugin"""
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from datetime import datetime, timedelta
 import ssl
 import socket
 import asyncio
 
-from app.domains.checks.plugins.ssl_check import SSLCheck
+from app.domains.checks.plugins import ssl_check as ssl_check_module
+from app.domains.checks.plugins.ssl_check import SSLCheck, _endpoint
+from app.domains.checks.plugins._tls_probe import TLSProbeResult
+
+
+def cert_info_for(cert):
+    """Build the info dict _get_certificate_info returns for a mock certificate"""
+    return {
+        "subject": "example.com",
+        "issuer": "Test CA",
+        "not_before_epoch": ssl.cert_time_to_seconds(cert["notBefore"]),
+        "not_after_epoch": ssl.cert_time_to_seconds(cert["notAfter"]),
+        "serial_number": "123456"
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_cert_cache():
+    """Keep cached certificates from leaking between tests"""
+    ssl_check_module._CERT_CACHE.clear()
+    yield
+    ssl_check_module._CERT_CACHE.clear()
 
 
 @pytest.fixture
@@ -76,16 +97,20 @@ class TestSSLCheck:
         # Check default values
         assert schema["properties"]["warning_days_before_expiry"]["default"] == 30
 
+    @pytest.mark.parametrize("site_url,expected", [
+        ("https://example.com", ("example.com", 443)),
+        ("https://example.com:8443/status", ("example.com", 8443)),
+        ("example.com/path?q=1", ("example.com", 443)),
+        ("example.com:444", ("example.com", 444)),
+    ])
+    def test_endpoint(self, site_url, expected):
+        """Test hostname and port extraction from site URLs"""
+        assert _endpoint(site_url) == expected
+
     @pytest.mark.asyncio
     async def test_execute_valid_cert(self, ssl_check, valid_cert):
         """Test SSL check with valid certificate"""
-        with patch.object(ssl_check, "_get_certificate_info", return_value={
-            "subject": "example.com",
-            "issuer": "Test CA",
-            "not_before": valid_cert["notBefore"],
-            "not_after": valid_cert["notAfter"],
-            "serial_number": "123456"
-        }):
+        with patch.object(ssl_check, "_get_certificate_info", return_value=cert_info_for(valid_cert)):
             result = await ssl_check.execute(
                 "https://example.com",
                 {"warning_days_before_expiry": 30}
@@ -97,13 +122,7 @@ class TestSSLCheck:
     @pytest.mark.asyncio
     async def test_execute_expiring_soon(self, ssl_check, expiring_cert):
         """Test SSL check with certificate expiring soon (warning)"""
-        with patch.object(ssl_check, "_get_certificate_info", return_value={
-            "subject": "example.com",
-            "issuer": "Test CA",
-            "not_before": expiring_cert["notBefore"],
-            "not_after": expiring_cert["notAfter"],
-            "serial_number": "123456"
-        }):
+        with patch.object(ssl_check, "_get_certificate_info", return_value=cert_info_for(expiring_cert)):
             result = await ssl_check.execute(
                 "https://example.com",
                 {"warning_days_before_expiry": 30}
@@ -116,13 +135,7 @@ class TestSSLCheck:
     @pytest.mark.asyncio
     async def test_execute_expired(self, ssl_check, expired_cert):
         """Test SSL check with expired certificate"""
-        with patch.object(ssl_check, "_get_certificate_info", return_value={
-            "subject": "example.com",
-            "issuer": "Test CA",
-            "not_before": expired_cert["notBefore"],
-            "not_after": expired_cert["notAfter"],
-            "serial_number": "123456"
-        }):
+        with patch.object(ssl_check, "_get_certificate_info", return_value=cert_info_for(expired_cert)):
             result = await ssl_check.execute(
                 "https://example.com",
                 {"warning_days_before_expiry": 30}
@@ -168,3 +181,65 @@ class TestSSLCheck:
             )
 
             assert result.status == "failure"
+
+    @pytest.mark.asyncio
+    async def test_execute_reuses_cached_certificate(self, ssl_check, valid_cert):
+        """Test repeated checks of the same endpoint reuse the cached certificate"""
+        cert_info = cert_info_for(valid_cert)
+        with patch.object(ssl_check, "_get_certificate_info", return_value=cert_info) as mock_get:
+            first = await ssl_check.execute("https://example.com", {})
+            second = await ssl_check.execute("https://example.com", {})
+
+            assert first.status == "success"
+            assert second.status == "success"
+            assert mock_get.call_count == 1
+            assert first.result_data["cached"] is False
+            assert second.result_data["cached"] is True
+            assert second.response_time_ms == first.response_time_ms
+
+    @pytest.mark.asyncio
+    async def test_execute_honors_shorter_ttl(self, ssl_check, valid_cert):
+        """Test a lower TTL than the one the entry was cached under forces a refetch"""
+        cert_info = cert_info_for(valid_cert)
+        with patch.object(ssl_check, "_get_certificate_info", return_value=cert_info) as mock_get:
+            await ssl_check.execute("https://example.com", {"cache_ttl_seconds": 3600})
+            key = ("example.com", 443)
+            fetched_at, fetch_ms, info = ssl_check_module._CERT_CACHE[key]
+            ssl_check_module._CERT_CACHE[key] = (fetched_at - 120, fetch_ms, info)
+
+            await ssl_check.execute("https://example.com", {"cache_ttl_seconds": 60})
+
+            assert mock_get.call_count == 2
+
+    def test_cache_is_bounded(self):
+        """Test the certificate cache evicts once it reaches its size cap"""
+        with patch.object(ssl_check_module, "_MAX_CERT_CACHE", 2):
+            for i in range(3):
+                ssl_check_module._remember_cert((f"host{i}.example.com", 443), 10, {})
+
+        assert len(ssl_check_module._CERT_CACHE) <= 2
+        assert ("host2.example.com", 443) in ssl_check_module._CERT_CACHE
+
+    @pytest.mark.asyncio
+    async def test_execute_cache_disabled(self, ssl_check, valid_cert):
+        """Test a zero TTL fetches the certificate on every run"""
+        cert_info = cert_info_for(valid_cert)
+        with patch.object(ssl_check, "_get_certificate_info", return_value=cert_info) as mock_get:
+            await ssl_check.execute("https://example.com", {"cache_ttl_seconds": 0})
+            await ssl_check.execute("https://example.com", {"cache_ttl_seconds": 0})
+
+            assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_certificate_info_reads_peercert(self, ssl_check, valid_cert):
+        """Test certificate info is projected from the shared TLS probe"""
+        probe_result = TLSProbeResult(peercert=valid_cert, tls_version="TLSv1.3", cipher="TLS_AES_256_GCM_SHA384")
+        with patch("app.domains.checks.plugins.ssl_check.probe", new=AsyncMock(return_value=probe_result)) as mock_probe:
+            cert_info = await ssl_check._get_certificate_info("example.com", 443, 10)
+
+            assert cert_info["subject"] == "example.com"
+            assert cert_info["issuer"] == "Test CA"
+            assert cert_info["serial_number"] == "123456"
+            assert cert_info["not_after_epoch"] == ssl.cert_time_to_seconds(valid_cert["notAfter"])
+            assert cert_info["tls_version"] == "TLSv1.3"
+            mock_probe.assert_awaited_once_with("example.com", 443, 10)
@@ -0,0 +1,73 @@
+"""Tests for the shared TLS handshake probe"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch, MagicMock
+
+from app.domains.checks.plugins import _tls_probe
+from app.domains.checks.plugins._tls_probe import probe
+
+
+def make_writer(peercert):
+    """Create a mock stream writer exposing TLS session details"""
+    ssl_object = MagicMock()
+    ssl_object.version.return_value = "TLSv1.3"
+    extra = {
+        "peercert": peercert,
+        "cipher": ("TLS_AES_256_GCM_SHA384", "TLSv1.3", 256),
+        "ssl_object": ssl_object,
+    }
+    writer = MagicMock()
+    writer.get_extra_info.side_effect = extra.get
+    writer.wait_closed = AsyncMock()
+    return writer
+
+
+class TestTLSProbe:
+    """Tests for the TLS probe"""
+
+    @pytest.mark.asyncio
+    async def test_probe_reads_session_details(self):
+        """Test probe returns certificate, protocol version and cipher"""
+        writer = make_writer({"serialNumber": "123456"})
+
+        async def fake_open_connection(*args, **kwargs):
+            return MagicMock(), writer
+
+        with patch("asyncio.open_connection", side_effect=fake_open_connection) as mock_open:
+            result = await probe("example.com", 443, 10)
+
+            assert result.peercert == {"serialNumber": "123456"}
+            assert result.tls_version == "TLSv1.3"
+            assert result.cipher == "TLS_AES_256_GCM_SHA384"
+            assert mock_open.call_args.kwargs["server_hostname"] == "example.com"
+            writer.close.assert_called_once()
+            writer.wait_closed.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_probes_share_handshake(self):
+        """Test concurrent probes of one endpoint open a single connection"""
+        writer = make_writer({})
+
+        async def fake_open_connection(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return MagicMock(), writer
+
+        with patch("asyncio.open_connection", side_effect=fake_open_connection) as mock_open:
+            first, second = await asyncio.gather(
+                probe("example.com", 443, 10),
+                probe("example.com", 443, 10),
+            )
+
+            assert first is second
+            assert mock_open.call_count == 1
+            assert _tls_probe._IN_FLIGHT == {}
+
+    @pytest.mark.asyncio
+    async def test_probe_propagates_errors(self):
+        """Test handshake errors reach the caller and clear the in-flight entry"""
+        with patch("asyncio.open_connection",
+                   side_effect=ConnectionRefusedError("Connection refused")):
+            with pytest.raises(ConnectionRefusedError):
+                await probe("example.com", 443, 10)
+
+            assert _tls_probe._IN_FLIGHT == {}
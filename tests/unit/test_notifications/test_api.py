@@ -0,0 +1,77 @@
+"""Tests for notifications API helpers"""
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import parse_qs
+
+from fastapi import HTTPException, Response
+from sqlalchemy import select
+
+from app.domains.notifications.api import NEXT_CURSOR_HEADER, _seek_page, _set_next_cursor, update_channel, update_rule
+from app.domains.notifications.models import NotificationChannel, NotificationChannelType
+from app.domains.notifications.schemas import NotificationChannelUpdate, NotificationRuleUpdate
+
+
+class TestKeysetPagination:
+    """Tests for list endpoint pagination"""
+
+    def test_half_cursor_rejected(self):
+        """Test that sending only one cursor half is a 422 rather than ignored"""
+        with pytest.raises(HTTPException) as exc_info:
+            _seek_page(select(NotificationChannel), NotificationChannel, 100, None, 5)
+        assert exc_info.value.status_code == 422
+
+    def test_full_page_sets_next_cursor(self):
+        """Test that a full page points at the item after its last one"""
+        created_at = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+        items = [SimpleNamespace(id=9, created_at=created_at), SimpleNamespace(id=7, created_at=created_at)]
+        response = Response()
+
+        _set_next_cursor(response, items, limit=2)
+
+        cursor = parse_qs(response.headers[NEXT_CURSOR_HEADER])
+        assert cursor == {"before_created_at": [created_at.isoformat()], "before_id": ["7"]}
+
+    def test_short_page_has_no_cursor(self):
+        """Test that the last page carries no cursor"""
+        response = Response()
+        _set_next_cursor(response, [SimpleNamespace(id=1, created_at=datetime.now(timezone.utc))], limit=2)
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+
+class TestUpdateRule:
+    """Tests for the update_rule endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_missing_rule_reported_before_bad_channel(self):
+        """Test that a missing rule is a 404 even when the new channel is invalid"""
+        db = MagicMock()
+        db.scalar = AsyncMock(return_value=None)
+        user = SimpleNamespace(organization_id=10)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await update_rule(1, NotificationRuleUpdate(channel_id=99), current_user=user, db=db)
+
+        assert exc_info.value.status_code == 404
+        db.scalar.assert_awaited_once()
+
+
+class TestUpdateChannel:
+    """Tests for the update_channel endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_invalid_configuration_rejected_before_write(self):
+        """Test that a bad configuration is rejected without issuing the UPDATE"""
+        db = MagicMock()
+        db.scalar = AsyncMock(return_value=NotificationChannelType.WEBHOOK)
+        db.execute = AsyncMock()
+        user = SimpleNamespace(organization_id=10)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await update_channel(
+                1, NotificationChannelUpdate(configuration={"method": "POST"}), current_user=user, db=db
+            )
+
+        assert exc_info.value.status_code == 400
+        db.execute.assert_not_awaited()
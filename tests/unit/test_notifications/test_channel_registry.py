@@ -1,4 +1,5 @@
 """Tests for notification channel registry"""
+import json
 import pytest
 from app.domains.notifications.channels.registry import ChannelRegistry
 from app.domains.notifications.channels.base import BaseNotificationChannel
@@ -20,6 +21,17 @@ class TestChannelRegistry:
         channel_class = ChannelRegistry.get_channel("email")
         assert issubclass(channel_class, BaseNotificationChannel)
 
+    def test_get_instance_is_shared(self):
+        """Test that get_instance returns one cached instance per type"""
+        instance = ChannelRegistry.get_instance("webhook")
+        assert isinstance(instance, ChannelRegistry.get_channel("webhook"))
+        assert ChannelRegistry.get_instance("webhook") is instance
+
+    def test_get_instance_unknown_type(self):
+        """Test that get_instance raises error for unknown type"""
+        with pytest.raises(KeyError):
+            ChannelRegistry.get_instance("unknown_channel_type")
+
     def test_get_channel_unknown_type(self):
         """Test that get_channel raises error for unknown type"""
         with pytest.raises(KeyError) as exc_info:
@@ -47,6 +59,40 @@ class TestChannelRegistry:
             assert "display_name" in channel
             assert "config_schema" in channel
 
+    def test_list_channels_reuses_schema(self):
+        """Test that channel metadata is built once rather than per call"""
+        first = {c["type"]: c for c in ChannelRegistry.list_channels()}
+        second = {c["type"]: c for c in ChannelRegistry.list_channels()}
+        assert first["email"]["config_schema"] is second["email"]["config_schema"]
+
+    def test_list_channels_json_matches_listing(self):
+        """Test that the serialized listing matches list_channels and is cached"""
+        body = ChannelRegistry.list_channels_json()
+        assert json.loads(body) == ChannelRegistry.list_channels()
+        assert ChannelRegistry.list_channels_json() is body
+
+    def test_validate_config_accepts_valid(self):
+        """Test that a complete configuration passes validation"""
+        errors = ChannelRegistry.validate_config("webhook", {"url": "https://example.com/hook", "method": "POST"})
+        assert errors == []
+
+    def test_validate_config_missing_required(self):
+        """Test that missing required fields are reported"""
+        errors = ChannelRegistry.validate_config("email", {"smtp_host": "smtp.example.com"})
+        assert any("from_address" in e for e in errors)
+        assert any("to_addresses" in e for e in errors)
+
+    def test_validate_config_wrong_type(self):
+        """Test that mistyped fields are reported"""
+        errors = ChannelRegistry.validate_config("email", {
+            "smtp_host": "smtp.example.com",
+            "from_address": "alerts@example.com",
+            "to_addresses": "ops@example.com",
+            "smtp_port": True
+        })
+        assert any("to_addresses" in e for e in errors)
+        assert any("smtp_port" in e for e in errors)
+
     def test_channel_instance_has_required_methods(self):
         """Test that channel instances have all required methods"""
         channel_class = ChannelRegistry.get_channel("email")
@@ -57,3 +103,9 @@ class TestChannelRegistry:
         assert hasattr(channel_instance, "send")
         assert hasattr(channel_instance, "get_config_schema")
         assert hasattr(channel_instance, "test_connection")
+
+    def test_builtin_channels_map_to_modules(self):
+        """Test that each built-in channel type maps to the module registering it"""
+        for channel_type, module_name in ChannelRegistry._BUILTIN_MODULES.items():
+            channel_class = ChannelRegistry.get_channel(channel_type)
+            assert channel_class.__module__ == module_name
@@ -0,0 +1,117 @@
+"""Tests for the background notification dispatcher"""
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timezone
+
+from app.domains.notifications.channels.base import NotificationPayload
+from app.domains.notifications.dispatcher import Delivery, NotificationDispatcher
+from app.domains.notifications.models import NotificationStatus
+
+
+def make_delivery(log_id):
+    payload = NotificationPayload(
+        trigger="check_failure",
+        site_name="Test Site",
+        site_url="https://example.com",
+        check_name="HTTP Check",
+        check_type="http",
+        status="failure",
+        checked_at=datetime.now(timezone.utc)
+    )
+    return Delivery(
+        log_id=log_id,
+        sent_at=payload.checked_at,
+        rule_name=f"Rule {log_id}",
+        channel_type="webhook",
+        configuration={"url": "https://example.com/hook"},
+        payload=payload,
+    )
+
+
+@pytest.fixture
+def mock_db():
+    """Patch the session used to record delivery outcomes"""
+    db = MagicMock()
+    db.execute = AsyncMock()
+
+    @asynccontextmanager
+    async def db_context():
+        yield db
+
+    with patch("app.domains.notifications.dispatcher.get_db_context", db_context):
+        yield db
+
+
+@pytest.fixture
+def mock_channel():
+    """Patch the channel instance deliveries are sent through"""
+    channel = MagicMock()
+    channel.send = AsyncMock(return_value=True)
+    with patch(
+        "app.domains.notifications.dispatcher.ChannelRegistry.get_instance",
+        return_value=channel
+    ):
+        yield channel
+
+
+class TestNotificationDispatcher:
+    """Tests for NotificationDispatcher"""
+
+    @pytest.mark.asyncio
+    async def test_submit_inline_when_not_running(self, mock_db, mock_channel):
+        """Test that deliveries are sent immediately without background workers"""
+        dispatcher = NotificationDispatcher()
+
+        delivery = make_delivery(1)
+        await dispatcher.submit([delivery])
+
+        mock_channel.send.assert_awaited_once()
+        delivery_updates = mock_db.execute.await_args.args[1]
+        assert delivery_updates == [{
+            "id": 1,
+            "sent_at": delivery.sent_at,
+            "status": NotificationStatus.SENT,
+            "error_message": None,
+        }]
+
+    @pytest.mark.asyncio
+    async def test_sends_concurrently_and_records_once(self, mock_db, mock_channel):
+        """Test that a batch overlaps its sends and records all outcomes together"""
+        in_flight = 0
+        peak = 0
+
+        async def send(config, payload):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if config.get("fail"):
+                raise RuntimeError("boom")
+            return True
+
+        mock_channel.send.side_effect = send
+        failing = replace(make_delivery(2), configuration={"fail": True})
+
+        await NotificationDispatcher._deliver([make_delivery(1), failing])
+
+        assert peak == 2
+        mock_db.execute.assert_awaited_once()
+        updates = mock_db.execute.await_args.args[1]
+        assert [u["status"] for u in updates] == [NotificationStatus.SENT, NotificationStatus.FAILED]
+        assert updates[1]["error_message"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_workers_drain_queue_on_stop(self, mock_db, mock_channel):
+        """Test that queued deliveries are sent before the dispatcher stops"""
+        dispatcher = NotificationDispatcher()
+        dispatcher.start(workers=2, batch_size=10)
+
+        await dispatcher.submit([make_delivery(i) for i in range(5)])
+        await dispatcher.stop()
+
+        assert mock_channel.send.await_count == 5
+        assert not dispatcher.is_running
@@ -3,10 +3,38 @@ import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
 
+import aiosmtplib
+
+from app.domains.notifications.channels import email as email_module
 from app.domains.notifications.channels.email import EmailChannel
 from app.domains.notifications.channels.base import NotificationPayload
 
 
+@pytest.fixture(autouse=True)
+def clear_smtp_pool():
+    """Keep pooled SMTP sessions from leaking between tests"""
+    email_module._SMTP_POOL.clear()
+    email_module._SMTP_LOCKS.clear()
+    email_module._SMTP_LAST_USED.clear()
+    EmailChannel._render.cache_clear()
+    yield
+    email_module._SMTP_POOL.clear()
+    email_module._SMTP_LOCKS.clear()
+    email_module._SMTP_LAST_USED.clear()
+
+
+@pytest.fixture
+def mock_smtp():
+    """Patch aiosmtplib.SMTP with a connected mock session"""
+    smtp = MagicMock()
+    smtp.is_connected = True
+    smtp.connect = AsyncMock()
+    smtp.send_message = AsyncMock(return_value={})
+    smtp.noop = AsyncMock()
+    with patch("aiosmtplib.SMTP", return_value=smtp):
+        yield smtp
+
+
 @pytest.fixture
 def email_channel():
     return EmailChannel()
@@ -65,39 +93,116 @@ class TestEmailChannel:
         assert "to_addresses" in schema.get("required", [])
 
     @pytest.mark.asyncio
-    async def test_send_success(self, email_channel, sample_payload, email_config):
+    async def test_send_success(self, email_channel, sample_payload, email_config, mock_smtp):
         """Test successful email delivery"""
-        with patch("aiosmtplib.send") as mock_send:
-            mock_send.return_value = {}
+        result = await email_channel.send(email_config, sample_payload)
 
-            result = await email_channel.send(email_config, sample_payload)
-
-            assert result is True
-            mock_send.assert_called_once()
+        assert result is True
+        mock_smtp.send_message.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_send_calls_smtp_with_correct_params(self, email_channel, sample_payload, email_config):
+    async def test_send_calls_smtp_with_correct_params(self, email_channel, sample_payload, email_config, mock_smtp):
         """Test that send calls SMTP with correct parameters"""
-        with patch("aiosmtplib.send") as mock_send:
-            mock_send.return_value = {}
-
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp) as mock_cls:
             await email_channel.send(email_config, sample_payload)
 
-            call_kwargs = mock_send.call_args.kwargs
+            call_kwargs = mock_cls.call_args.kwargs
             assert call_kwargs["hostname"] == "smtp.example.com"
             assert call_kwargs["port"] == 587
             assert call_kwargs["username"] == "user@example.com"
+            assert call_kwargs["start_tls"] is True
+
+    @pytest.mark.asyncio
+    async def test_send_builds_multipart_message(self, email_channel, sample_payload, email_config, mock_smtp):
+        """Test that the message carries plain text and HTML alternatives"""
+        await email_channel.send(email_config, sample_payload)
+
+        msg = mock_smtp.send_message.call_args.args[0]
+        assert msg.get_content_type() == "multipart/alternative"
+        assert msg.get_body(preferencelist=("plain",)) is not None
+        assert "Test Site" in msg.get_body(preferencelist=("html",)).get_content()
+
+    @pytest.mark.asyncio
+    async def test_send_reuses_connection(self, email_channel, sample_payload, email_config, mock_smtp):
+        """Test that consecutive sends share one SMTP session"""
+        await email_channel.send(email_config, sample_payload)
+        await email_channel.send(email_config, sample_payload)
+
+        mock_smtp.connect.assert_called_once()
+        assert mock_smtp.send_message.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_send_skips_noop_for_recently_used_session(self, email_channel, sample_payload, email_config, mock_smtp):
+        """Test that a session used moments ago is reused without a NOOP"""
+        await email_channel.send(email_config, sample_payload)
+        await email_channel.send(email_config, sample_payload)
+
+        mock_smtp.noop.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_noops_idle_session(self, email_channel, sample_payload, email_config, mock_smtp):
+        """Test that a long-idle session is checked with NOOP before reuse"""
+        await email_channel.send(email_config, sample_payload)
+        for key in email_module._SMTP_LAST_USED:
+            email_module._SMTP_LAST_USED[key] -= email_module.SMTP_IDLE_CHECK_SECONDS + 1
+
+        await email_channel.send(email_config, sample_payload)
+
+        mock_smtp.noop.assert_awaited_once()
+        mock_smtp.connect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_send_reconnects_when_noop_fails(self, email_channel, sample_payload, email_config, mock_smtp):
+        """Test that a session the server dropped while idle is replaced before sending"""
+        await email_channel.send(email_config, sample_payload)
+        for key in email_module._SMTP_LAST_USED:
+            email_module._SMTP_LAST_USED[key] -= email_module.SMTP_IDLE_CHECK_SECONDS + 1
+        mock_smtp.noop.side_effect = aiosmtplib.SMTPServerDisconnected("Idle timeout")
+
+        await email_channel.send(email_config, sample_payload)
+
+        assert mock_smtp.connect.call_count == 2
+        assert mock_smtp.send_message.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_send_smtp_error(self, email_channel, sample_payload, email_config):
+    async def test_send_reconnects_after_disconnect(self, email_channel, sample_payload, email_config, mock_smtp):
+        """Test that a dropped session is reopened and the send retried"""
+        mock_smtp.send_message.side_effect = [
+            aiosmtplib.SMTPServerDisconnected("Connection lost"),
+            {},
+        ]
+
+        result = await email_channel.send(email_config, sample_payload)
+
+        assert result is True
+        assert mock_smtp.connect.call_count == 2
+        assert mock_smtp.send_message.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_send_retry_failure_evicts_session(self, email_channel, sample_payload, email_config, mock_smtp):
+        """Test that a session whose retry also fails is closed and not pooled"""
+        mock_smtp.send_message.side_effect = [
+            aiosmtplib.SMTPServerDisconnected("Connection lost"),
+            aiosmtplib.SMTPServerDisconnected("Connection lost again"),
+        ]
+
+        with pytest.raises(aiosmtplib.SMTPServerDisconnected):
+            await email_channel.send(email_config, sample_payload)
+
+        assert mock_smtp.send_message.call_count == 2
+        mock_smtp.close.assert_called_once()
+        assert email_module._SMTP_POOL == {}
+
+    @pytest.mark.asyncio
+    async def test_send_smtp_error(self, email_channel, sample_payload, email_config, mock_smtp):
         """Test email send with SMTP error"""
-        with patch("aiosmtplib.send") as mock_send:
-            mock_send.side_effect = Exception("SMTP connection failed")
+        mock_smtp.send_message.side_effect = Exception("SMTP connection failed")
 
-            with pytest.raises(Exception) as exc_info:
-                await email_channel.send(email_config, sample_payload)
+        with pytest.raises(Exception) as exc_info:
+            await email_channel.send(email_config, sample_payload)
 
-            assert "SMTP connection failed" in str(exc_info.value)
+        assert "SMTP connection failed" in str(exc_info.value)
+        assert email_module._SMTP_POOL == {}
 
     @pytest.mark.asyncio
     async def test_test_connection_success(self, email_channel, email_config):
@@ -165,6 +270,36 @@ class TestEmailChannel:
         assert "HTTP Check" in html
         assert "Connection refused" in html
 
+    def test_build_html_body_escapes_fields(self, email_channel, sample_payload):
+        """Test that payload text is HTML-escaped in the body"""
+        payload = sample_payload.model_copy(update={
+            "site_name": "<script>alert(1)</script>",
+            "error_message": 'Bad "quote" & <tag>'
+        })
+        html = email_channel._build_html_body(payload)
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+        assert "Bad &quot;quote&quot; &amp; &lt;tag&gt;" in html
+
+    def test_render_reuses_output_for_same_payload(self, email_channel, sample_payload):
+        """Test that rendering the same payload twice is served from cache"""
+        first = email_channel._render(sample_payload)
+        second = email_channel._render(sample_payload)
+
+        assert first is second
+        assert EmailChannel._render.cache_info().hits == 1
+
+    def test_render_cache_survives_derived_values(self, email_channel, sample_payload):
+        """Test that computing derived payload values doesn't change its cache key"""
+        first = email_channel._render(sample_payload)
+        sample_payload.json_body
+        second = email_channel._render(sample_payload)
+
+        assert first is second
+        assert EmailChannel._render.cache_info().hits == 1
+        assert "json_body" not in sample_payload.__dict__
+
     def test_build_text_body(self, email_channel, sample_payload):
         """Test plain text body building"""
         text = email_channel._build_text_body(sample_payload)
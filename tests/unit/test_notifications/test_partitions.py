@@ -0,0 +1,45 @@
+"""Tests for notification log partition maintenance"""
+import pytest
+from contextlib import asynccontextmanager
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.domains.notifications.partitions import ensure_log_partitions, month_ranges
+
+
+class TestMonthRanges:
+    """Tests for month_ranges"""
+
+    def test_current_month_and_following(self):
+        """Test that ranges start at the first of the month and are contiguous"""
+        assert month_ranges(date(2026, 10, 16), 2) == [
+            (date(2026, 10, 1), date(2026, 11, 1)),
+            (date(2026, 11, 1), date(2026, 12, 1)),
+            (date(2026, 12, 1), date(2027, 1, 1)),
+        ]
+
+    def test_wraps_year(self):
+        """Test that December rolls over into January"""
+        assert month_ranges(date(2026, 12, 31), 1)[-1] == (date(2027, 1, 1), date(2027, 2, 1))
+
+
+class TestEnsureLogPartitions:
+    """Tests for ensure_log_partitions"""
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_stop_other_partitions(self):
+        """Test that each partition is created independently"""
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[RuntimeError("overlaps default"), None, None, None])
+
+        @asynccontextmanager
+        async def db_context():
+            yield db
+
+        with patch("app.domains.notifications.partitions.get_db_context", db_context):
+            await ensure_log_partitions(months_ahead=2)
+
+        statements = [str(c.args[0]) for c in db.execute.await_args_list]
+        assert len(statements) == 4
+        assert "DEFAULT" in statements[0]
+        assert all("PARTITION OF notification_logs" in s for s in statements)
@@ -0,0 +1,182 @@
+"""Tests for notification service"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timezone
+
+from app.domains.checks.models import CheckStatus
+from app.domains.notifications.models import NotificationChannelType, NotificationTrigger
+from app.domains.notifications import service as service_module
+from app.domains.notifications.service import NotificationService
+
+
+@pytest.fixture
+def site():
+    return SimpleNamespace(id=1, organization_id=10, name="Test Site", url="https://example.com")
+
+
+@pytest.fixture
+def check_config():
+    return SimpleNamespace(id=5, name="HTTP Check", check_type="http")
+
+
+def make_result(status):
+    return SimpleNamespace(
+        id=100,
+        status=status,
+        error_message=None,
+        response_time_ms=None,
+        checked_at=datetime.now(timezone.utc),
+    )
+
+
+def make_db():
+    db = MagicMock()
+    # INSERT ... RETURNING hands back one (id, sent_at) per pending log row
+    sent_at = datetime.now(timezone.utc)
+    db.execute = AsyncMock(side_effect=lambda stmt, rows: MagicMock(
+        all=MagicMock(return_value=[(1000 + i, sent_at) for i in range(len(rows))])
+    ))
+    db.commit = AsyncMock()
+    return db
+
+
+def make_rule(rule_id, consecutive_failures=1):
+    channel = SimpleNamespace(channel_type=NotificationChannelType.WEBHOOK, configuration={"url": "https://example.com/hook"})
+    return SimpleNamespace(id=rule_id, name=f"Rule {rule_id}", consecutive_failures=consecutive_failures, channel=channel)
+
+
+def submitted(service_mocks):
+    """Deliveries handed to the dispatcher, across all submit calls"""
+    return [d for c in service_mocks.submit.await_args_list for d in c.args[0]]
+
+
+@pytest.fixture
+def service_mocks():
+    """Patch the service's database helpers"""
+    with patch.object(NotificationService, "_has_rules", new=AsyncMock(return_value=True)) as has_rules, \
+         patch.object(NotificationService, "_recent_statuses", new_callable=AsyncMock) as statuses, \
+         patch.object(NotificationService, "_find_matching_rules", new_callable=AsyncMock) as find_rules, \
+         patch.object(service_module.notification_dispatcher, "submit", new_callable=AsyncMock) as submit:
+        yield SimpleNamespace(has_rules=has_rules, statuses=statuses, find_rules=find_rules, submit=submit)
+
+
+class TestHandleCheckResult:
+    """Tests for NotificationService.handle_check_result"""
+
+    @pytest.mark.asyncio
+    async def test_success_without_prior_failure_is_ignored(self, site, check_config, service_mocks):
+        """Test that a success following a success sends nothing"""
+        service_mocks.statuses.return_value = [CheckStatus.SUCCESS, CheckStatus.SUCCESS]
+
+        await NotificationService.handle_check_result(make_db(), check_config, make_result(CheckStatus.SUCCESS), site)
+
+        service_mocks.find_rules.assert_not_awaited()
+        service_mocks.submit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_success_after_failure_is_recovery(self, site, check_config, service_mocks):
+        """Test that a success following a failure triggers recovery rules"""
+        service_mocks.statuses.return_value = [CheckStatus.SUCCESS, CheckStatus.FAILURE]
+        service_mocks.find_rules.return_value = [make_rule(1)]
+
+        await NotificationService.handle_check_result(make_db(), check_config, make_result(CheckStatus.SUCCESS), site)
+
+        assert service_mocks.find_rules.await_args.args[2] == NotificationTrigger.CHECK_RECOVERY
+        assert len(submitted(service_mocks)) == 1
+
+    @pytest.mark.asyncio
+    async def test_quiet_trigger_skips_all_queries(self, site, check_config, service_mocks):
+        """Test that nothing else is queried when the org has no rules for the trigger"""
+        service_mocks.has_rules.return_value = False
+
+        await NotificationService.handle_check_result(make_db(), check_config, make_result(CheckStatus.SUCCESS), site)
+
+        service_mocks.statuses.assert_not_awaited()
+        service_mocks.find_rules.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_history_when_not_needed(self, site, check_config, service_mocks):
+        """Test that history is not queried when no rule needs consecutive failures"""
+        service_mocks.find_rules.return_value = [make_rule(1), make_rule(2)]
+
+        await NotificationService.handle_check_result(make_db(), check_config, make_result(CheckStatus.FAILURE), site)
+
+        service_mocks.statuses.assert_not_awaited()
+        assert len(submitted(service_mocks)) == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_history_fetched_once_for_all_rules(self, site, check_config, service_mocks):
+        """Test that one history query serves every rule's consecutive failure threshold"""
+        service_mocks.statuses.return_value = [CheckStatus.FAILURE, CheckStatus.FAILURE, CheckStatus.SUCCESS]
+        service_mocks.find_rules.return_value = [make_rule(1, 2), make_rule(2, 3), make_rule(3, 1)]
+
+        await NotificationService.handle_check_result(make_db(), check_config, make_result(CheckStatus.FAILURE), site)
+
+        service_mocks.statuses.assert_awaited_once()
+        assert service_mocks.statuses.await_args.kwargs["limit"] == 3
+        assert [d.rule_name for d in submitted(service_mocks)] == ["Rule 1", "Rule 3"]
+
+
+    @pytest.mark.asyncio
+    async def test_logs_committed_before_dispatch(self, site, check_config, service_mocks):
+        """Test that pending logs are committed and then handed to the dispatcher"""
+        service_mocks.find_rules.return_value = [make_rule(1), make_rule(2)]
+        db = make_db()
+        order = []
+        db.commit.side_effect = lambda: order.append("commit")
+        service_mocks.submit.side_effect = lambda deliveries: order.append("submit")
+
+        await NotificationService.handle_check_result(db, check_config, make_result(CheckStatus.FAILURE), site)
+
+        assert order == ["commit", "submit"]
+        db.execute.assert_awaited_once()
+        rows = db.execute.await_args.args[1]
+        assert [row["rule_id"] for row in rows] == [1, 2]
+        deliveries = submitted(service_mocks)
+        assert [d.log_id for d in deliveries] == [1000, 1001]
+        assert all(d.channel_type == "webhook" for d in deliveries)
+
+
+class TestRulePresenceCache:
+    """Tests for the rule presence cache"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        service_module._rule_presence_cache.clear()
+        yield
+        service_module._rule_presence_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_answer_is_cached(self):
+        """Test that repeated lookups reuse the cached answer"""
+        db = MagicMock()
+        db.scalar = AsyncMock(return_value=False)
+
+        assert not await NotificationService._has_rules(db, 10, NotificationTrigger.CHECK_FAILURE)
+        assert not await NotificationService._has_rules(db, 10, NotificationTrigger.CHECK_FAILURE)
+
+        db.scalar.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_requery(self):
+        """Test that invalidation drops the organization's cached answers"""
+        db = MagicMock()
+        db.scalar = AsyncMock(side_effect=[False, True])
+
+        assert not await NotificationService._has_rules(db, 10, NotificationTrigger.CHECK_FAILURE)
+        NotificationService.invalidate_rule_cache(10)
+        assert await NotificationService._has_rules(db, 10, NotificationTrigger.CHECK_FAILURE)
+
+
+class TestCountLeadingFailures:
+    """Tests for NotificationService._count_leading_failures"""
+
+    def test_counts_until_first_non_failure(self):
+        """Test that counting stops at the first non-failure"""
+        statuses = [CheckStatus.FAILURE, CheckStatus.FAILURE, CheckStatus.SUCCESS, CheckStatus.FAILURE]
+        assert NotificationService._count_leading_failures(statuses) == 2
+
+    def test_empty_history(self):
+        """Test that an empty history has no failures"""
+        assert NotificationService._count_leading_failures([]) == 0
@@ -1,11 +1,15 @@
 """Tests for webhook notification channel"""
+import json
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
 import httpx
 
-from app.domains.notifications.channels.webhook import WebhookChannel
+from pydantic import ValidationError
+
+from app.domains.notifications.channels.webhook import WebhookChannel, parse_config
 from app.domains.notifications.channels.base import NotificationPayload
+from app.domains.notifications.channels.registry import ChannelRegistry
 
 
 @pytest.fixture
@@ -13,6 +17,19 @@ def webhook_channel():
     return WebhookChannel()
 
 
+@pytest.fixture
+def mock_client():
+    """Patch the shared HTTP client used by the webhook channel"""
+    client = MagicMock()
+    # Real request building, so tests can inspect what would go on the wire
+    client.build_request = httpx.AsyncClient().build_request
+    with patch(
+        "app.domains.notifications.channels.webhook.get_client",
+        new=AsyncMock(return_value=client)
+    ):
+        yield client
+
+
 @pytest.fixture
 def sample_payload():
     return NotificationPayload(
@@ -48,8 +65,61 @@ class TestWebhookChannel:
         assert "auth_type" in schema["properties"]
         assert "url" in schema.get("required", [])
 
+    def test_served_config_schema_is_pinned(self):
+        """Test that the schema served to the settings form keeps its hand-written shape"""
+        served = {c["type"]: c for c in json.loads(ChannelRegistry.list_channels_json())}
+        assert served["webhook"]["config_schema"] == {
+            "type": "object",
+            "required": ["url"],
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "format": "uri",
+                    "title": "Webhook URL",
+                    "description": "URL to send notifications to"
+                },
+                "method": {
+                    "type": "string",
+                    "enum": ["POST", "PUT"],
+                    "default": "POST",
+                    "title": "HTTP Method",
+                    "description": "HTTP method to use"
+                },
+                "headers": {
+                    "type": "object",
+                    "additionalProperties": {"type": "string"},
+                    "default": {},
+                    "title": "Custom Headers",
+                    "description": "Additional HTTP headers to include"
+                },
+                "auth_type": {
+                    "type": "string",
+                    "enum": ["none", "bearer", "basic"],
+                    "default": "none",
+                    "title": "Authentication Type",
+                    "description": "Type of authentication to use"
+                },
+                "auth_token": {
+                    "type": "string",
+                    "title": "Bearer Token",
+                    "description": "Bearer token for authentication (if auth_type is 'bearer')"
+                },
+                "auth_username": {
+                    "type": "string",
+                    "title": "Basic Auth Username",
+                    "description": "Username for basic authentication (if auth_type is 'basic')"
+                },
+                "auth_password": {
+                    "type": "string",
+                    "title": "Basic Auth Password",
+                    "format": "password",
+                    "description": "Password for basic authentication (if auth_type is 'basic')"
+                }
+            }
+        }
+
     @pytest.mark.asyncio
-    async def test_send_success(self, webhook_channel, sample_payload):
+    async def test_send_success(self, webhook_channel, sample_payload, mock_client):
         """Test successful webhook delivery"""
         config = {
             "url": "https://hooks.example.com/webhook",
@@ -60,17 +130,35 @@ class TestWebhookChannel:
         mock_response.status_code = 200
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                return_value=mock_response
-            )
+        mock_client.send = AsyncMock(return_value=mock_response)
 
-            result = await webhook_channel.send(config, sample_payload)
+        result = await webhook_channel.send(config, sample_payload)
 
-            assert result is True
+        assert result is True
+        request = mock_client.send.call_args.args[0]
+        assert request.method == "POST"
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.headers["Content-Length"] == str(len(request.content))
+        assert json.loads(request.content)["site_name"] == "Test Site"
 
     @pytest.mark.asyncio
-    async def test_send_with_bearer_auth(self, webhook_channel, sample_payload):
+    async def test_send_reuses_serialized_body(self, webhook_channel, sample_payload, mock_client):
+        """Test that the payload is serialized once and shared across sends"""
+        config = {"url": "https://api.example.com/webhook"}
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_client.send = AsyncMock(return_value=mock_response)
+
+        await webhook_channel.send(config, sample_payload)
+        await webhook_channel.send(config, sample_payload)
+
+        first, second = (c.args[0].content for c in mock_client.send.call_args_list)
+        assert first is second
+        assert set(json.loads(first)) == set(type(sample_payload).model_fields)
+
+    @pytest.mark.asyncio
+    async def test_send_with_bearer_auth(self, webhook_channel, sample_payload, mock_client):
         """Test webhook with bearer authentication"""
         config = {
             "url": "https://api.example.com/webhook",
@@ -82,19 +170,16 @@ class TestWebhookChannel:
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = mock_client.return_value.__aenter__.return_value
-            mock_instance.request = AsyncMock(return_value=mock_response)
+        mock_client.send = AsyncMock(return_value=mock_response)
 
-            await webhook_channel.send(config, sample_payload)
+        await webhook_channel.send(config, sample_payload)
 
-            # Verify Authorization header was included
-            call_kwargs = mock_instance.request.call_args
-            assert "Authorization" in call_kwargs.kwargs.get("headers", {})
-            assert "Bearer secret-token" in call_kwargs.kwargs["headers"]["Authorization"]
+        # Verify Authorization header was included
+        request = mock_client.send.call_args.args[0]
+        assert request.headers["Authorization"] == "Bearer secret-token"
 
     @pytest.mark.asyncio
-    async def test_send_with_basic_auth(self, webhook_channel, sample_payload):
+    async def test_send_with_basic_auth(self, webhook_channel, sample_payload, mock_client):
         """Test webhook with basic authentication"""
         config = {
             "url": "https://api.example.com/webhook",
@@ -107,18 +192,15 @@ class TestWebhookChannel:
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = mock_client.return_value.__aenter__.return_value
-            mock_instance.request = AsyncMock(return_value=mock_response)
+        mock_client.send = AsyncMock(return_value=mock_response)
 
-            await webhook_channel.send(config, sample_payload)
+        await webhook_channel.send(config, sample_payload)
 
-            # Verify auth was passed
-            call_kwargs = mock_instance.request.call_args
-            assert call_kwargs.kwargs.get("auth") is not None
+        # Verify auth was passed
+        assert isinstance(mock_client.send.call_args.kwargs.get("auth"), httpx.BasicAuth)
 
     @pytest.mark.asyncio
-    async def test_send_with_custom_headers(self, webhook_channel, sample_payload):
+    async def test_send_with_custom_headers(self, webhook_channel, sample_payload, mock_client):
         """Test webhook with custom headers"""
         config = {
             "url": "https://hooks.example.com/webhook",
@@ -129,17 +211,15 @@ class TestWebhookChannel:
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = mock_client.return_value.__aenter__.return_value
-            mock_instance.request = AsyncMock(return_value=mock_response)
+        mock_client.send = AsyncMock(return_value=mock_response)
 
-            await webhook_channel.send(config, sample_payload)
+        await webhook_channel.send(config, sample_payload)
 
-            call_kwargs = mock_instance.request.call_args
-            assert "X-Custom-Header" in call_kwargs.kwargs.get("headers", {})
+        request = mock_client.send.call_args.args[0]
+        assert request.headers["X-Custom-Header"] == "custom-value"
 
     @pytest.mark.asyncio
-    async def test_send_http_error(self, webhook_channel, sample_payload):
+    async def test_send_http_error(self, webhook_channel, sample_payload, mock_client):
         """Test webhook with HTTP error response"""
         config = {
             "url": "https://hooks.example.com/webhook",
@@ -155,26 +235,99 @@ class TestWebhookChannel:
             )
         )
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                return_value=mock_response
-            )
+        mock_client.send = AsyncMock(return_value=mock_response)
 
-            with pytest.raises(httpx.HTTPStatusError):
-                await webhook_channel.send(config, sample_payload)
+        with pytest.raises(httpx.HTTPStatusError):
+            await webhook_channel.send(config, sample_payload)
 
     @pytest.mark.asyncio
-    async def test_test_connection_success(self, webhook_channel):
+    async def test_test_connection_success(self, webhook_channel, mock_client):
         """Test connection test success"""
         config = {"url": "https://hooks.example.com/webhook"}
 
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.options = AsyncMock(
-                return_value=mock_response
-            )
+        mock_client.head = AsyncMock(return_value=mock_response)
+
+        result = await webhook_channel.test_connection(config)
+        assert result is True
+        mock_client.head.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_test_connection_reuses_recent_result(self, webhook_channel, mock_client):
+        """Test that a recent successful probe is not repeated"""
+        config = {"url": "https://hooks.example.com/probe-cache", "auth_type": "bearer", "auth_token": "a"}
+        mock_client.head = AsyncMock(return_value=MagicMock(status_code=405))
 
-            result = await webhook_channel.test_connection(config)
-            assert result is True
+        assert await webhook_channel.test_connection(config)
+        assert await webhook_channel.test_connection(dict(config))
+        mock_client.head.assert_awaited_once()
+
+        # Different credentials are probed separately
+        assert await webhook_channel.test_connection({**config, "auth_token": "b"})
+        assert mock_client.head.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_test_connection_server_error_not_cached(self, webhook_channel, mock_client):
+        """Test that a failing endpoint raises and is probed again next time"""
+        config = {"url": "https://hooks.example.com/probe-error"}
+        request = httpx.Request("HEAD", config["url"])
+        mock_client.head = AsyncMock(return_value=httpx.Response(503, request=request))
+
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await webhook_channel.test_connection(config)
+        assert mock_client.head.await_count == 2
+
+
+class TestParseConfig:
+    """Tests for webhook configuration parsing"""
+
+    def test_applies_defaults(self):
+        """Test that omitted settings fall back to their defaults"""
+        webhook = parse_config({"url": "https://hooks.example.com/webhook"})
+        assert webhook.method == "POST"
+        assert webhook.auth_type == "none"
+        assert webhook.headers == {}
+
+    def test_normalizes_method(self):
+        """Test that a lowercase method is accepted"""
+        assert parse_config({"url": "https://hooks.example.com/webhook", "method": "put"}).method == "PUT"
+
+    def test_reuses_parsed_config(self):
+        """Test that equal configurations are validated once"""
+        config = {"url": "https://hooks.example.com/webhook", "headers": {"X-Key": "1"}}
+        assert parse_config(config) is parse_config(dict(config))
+
+    def test_prepares_request_details_once(self):
+        """Test that headers and auth are built once per configuration"""
+        webhook = parse_config({
+            "url": "https://hooks.example.com/webhook",
+            "auth_type": "basic",
+            "auth_username": "user",
+            "auth_password": "pass",
+        })
+        assert webhook.send_headers["Content-Type"] == "application/json"
+        assert webhook.send_headers is webhook.send_headers
+        assert webhook.auth is webhook.auth
+        assert "send_headers" not in WebhookChannel().get_config_schema()["properties"]
+
+    def test_request_template_reused_per_client(self):
+        """Test that requests are cloned from a template built once per client"""
+        webhook = parse_config({"url": "https://hooks.example.com/template", "headers": {"X-Key": "1"}})
+        client = httpx.AsyncClient()
+
+        with patch.object(client, "build_request", wraps=client.build_request) as build:
+            first = webhook.build_request(client, b'{"a": 1}')
+            second = webhook.build_request(client, b"{}")
+
+        build.assert_called_once()
+        assert first.headers["X-Key"] == "1"
+        assert second.headers["Content-Length"] == "2"
+        assert second.content == b"{}"
+
+    def test_rejects_invalid_config(self):
+        """Test that a config without a valid URL is rejected"""
+        with pytest.raises(ValidationError):
+            parse_config({"url": "not a url"})